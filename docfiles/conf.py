@@ -10,26 +10,157 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
+import functools
+import hashlib
 import os
+import pickle
+import re
 import sys
+import sysconfig
 import importlib
+import tempfile
+from datetime import datetime, timezone
 
-sys.path.append(os.path.abspath("../"))
+
+def _append_unique(path):
+    """
+    Adds the given directory to the end of sys.path, if it is not present yet.
+
+    Sphinx executes this file again in every parallel worker. Without the check,
+    each execution would add another entry that all subsequent imports have to scan.
+
+    Args:
+        path: The directory to add.
+    """
+    path = os.path.abspath(path)
+    if path not in sys.path:
+        sys.path.append(path)
+
+
+_append_unique("../")
+
+
+@functools.lru_cache(maxsize=1)
+def _bootstrap():
+    """
+    Imports package.py and adds the package source directory to the path.
+
+    This is deferred until it is actually needed, so that invocations which do not
+    build anything (e.g. sphinx-build --help) and cached configurations do not pay
+    for it.
+
+    Returns:
+        Tuple consisting of the package.py module and its settings instance.
+    """
+    packagemod = importlib.import_module("package", "..")
+    packagesettings = packagemod.Settings()
+    _append_unique(packagesettings.SRC_DIR)
+    return packagemod, packagesettings
 
 
 # -- Project information -----------------------------------------------------
-packagemod = importlib.import_module("package", "..")
-meta = packagemod.Meta("../pyproject.toml")
 
-project = meta.get("name")
-copyright = meta.getCopyright()
-author = ", ".join(meta.getAuthors())
 
-# The full version, including alpha/beta/rc tags
-release = meta.get("version")
-packagesettings = packagemod.Settings()
+def _dependency_modules(dependencies):
+    """
+    Returns the top-level modules provided by the given installed dependencies.
+
+    Distribution and import names often differ (e.g. PyYAML provides yaml), so the
+    modules are looked up in the metadata of the installed distributions.
+
+    Args:
+        dependencies: The requirement specifiers as given in pyproject.toml.
+
+    Returns:
+        Sorted list of module names. Dependencies that are not installed are missing.
+    """
+    if not dependencies:
+        return []
+
+    from importlib.metadata import packages_distributions
+
+    def normalize(name):
+        return re.sub(r"[-_.]+", "-", name).lower()
+
+    wanted = {
+        normalize(re.match(r"[A-Za-z0-9_.\-]*", dep.strip()).group(0))
+        for dep in dependencies
+    }
+    return sorted(
+        module
+        for module, dists in packages_distributions().items()
+        if any(normalize(d) in wanted for d in dists)
+    )
+
 
-sys.path.append(os.path.abspath(packagesettings.SRC_DIR))
+def _load_meta_cached(path):
+    """
+    Returns the meta information and the modules to mock for the given config file.
+
+    The values are cached in the temporary directory and only determined again if the
+    config file, package.py (which holds the settings) or the installed packages
+    changed since the last run.
+
+    Args:
+        path: Path to the pyproject.toml file to read the meta information from.
+
+    Returns:
+        Dictionary with the keys "name", "version", "authors", "copyright" and
+        "mock_imports".
+    """
+    fields = ("name", "version", "authors", "copyright", "mock_imports")
+    path = os.path.abspath(path)
+    watched = [path, os.path.join(os.path.dirname(path), "package.py")]
+    # Installing or removing a package changes the modification time of these.
+    watched += sorted({sysconfig.get_path("purelib"), sysconfig.get_path("platlib")})
+    stats = []
+    for file in watched:
+        try:
+            stat = os.stat(file)
+            stats.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stats.append(None)
+    # The copyright notice contains the current year, so include it in the key.
+    key = (tuple(stats), datetime.now(timezone.utc).year, fields)
+    digest = hashlib.blake2b(path.encode("utf-8"), digest_size=8).hexdigest()
+    cachefile = os.path.join(tempfile.gettempdir(), f"conf_meta_{digest}.pkl")
+
+    try:
+        with open(cachefile, "rb") as f:
+            cached = pickle.load(f)
+        if cached["key"] == key:
+            return cached["vals"]
+    except (OSError, EOFError, KeyError, TypeError, pickle.UnpicklingError):
+        pass  # No usable cache. Parse the config file instead.
+
+    packagemod, packagesettings = _bootstrap()
+    meta = packagemod.Meta(path)
+    vals = {
+        "name": meta.get("name"),
+        "version": meta.get("version"),
+        "authors": meta.getAuthors(),
+        "copyright": meta.getCopyright(),
+        "mock_imports": _dependency_modules(meta.getDependencies())
+        + list(packagesettings.DOCUMENTATION_MOCK_IMPORTS),
+    }
+
+    try:
+        with open(cachefile, "wb") as f:
+            pickle.dump({"key": key, "vals": vals}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Caching is optional.
+
+    return vals
+
+
+meta = _load_meta_cached("../pyproject.toml")
+
+project = meta["name"]
+copyright = meta["copyright"]
+author = ", ".join(meta["authors"])
+
+# The full version, including alpha/beta/rc tags
+release = meta["version"]
 
 
 # -- General configuration ---------------------------------------------------
@@ -49,14 +180,32 @@ templates_path = ["_templates"]
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
-exclude_patterns = []
+exclude_patterns = [
+    "_build",
+    "build",
+    "doctrees",
+    "Thumbs.db",
+    ".DS_Store",
+    "**/.ipynb_checkpoints",
+]
+
+# Set the environment variable SPHINX_ONLY to a glob pattern (e.g. "source/mymodule*")
+# to only read the matching documents when working on a single page.
+if os.environ.get("SPHINX_ONLY"):
+    include_patterns = ["index.*", os.environ["SPHINX_ONLY"]]
 
 # -- Options for HTML output -------------------------------------------------
 
 # The theme to use for HTML and HTML Help pages.  See the documentation for
-# a list of builtin themes.
+# a list of builtin themes. Set the environment variable SPHINX_FAST_THEME to use
+# the builtin alabaster theme, which writes pages considerably faster.
 #
-html_theme = "pydata_sphinx_theme"
+if os.environ.get("SPHINX_FAST_THEME"):
+    html_theme = "alabaster"
+else:
+    html_theme = "pydata_sphinx_theme"
+    # Rendering the full, expandable navigation tree on every page is expensive.
+    html_theme_options = {"navigation_depth": 2, "collapse_navigation": True}
 
 # Add any paths that contain custom static files (such as style sheets) here,
 # relative to this directory. They are copied after the builtin static files,
@@ -76,6 +225,17 @@ myst_enable_extensions = [
     "tasklist",
 ]
 
+# Mock the dependencies of the package, so that autodoc does not have to import them
+# (and everything they import in turn) on every build. Only the package itself is
+# imported, which DocInspector needs for comparing docstrings and signatures. Modules
+# that cannot be determined automatically are listed in the package.py settings.
+# Modules that have already been imported are left out, because mocking does not
+# affect them.
+autodoc_mock_imports = [m for m in meta["mock_imports"] if m not in sys.modules]
+
+# Sphinx pickles the configuration into its environment to detect changes between
+# builds. Keep this a plain dict, because an unpicklable value (like a read-only
+# mapping proxy) cannot be cached and would trigger a full rebuild every time.
 autodoc_default_options = {
     "member-order": "groupwise",
     "special-members": "__init__",
@@ -84,6 +244,17 @@ autodoc_default_options = {
 
 
 def setup(app):
+    packagemod, packagesettings = _bootstrap()
     docinspect = packagemod.DocInspector(packagesettings)
+    app.connect("builder-inited", docinspect.reset)
     app.connect("autodoc-process-docstring", docinspect.process)
+    app.connect("env-merge-info", docinspect.merge)
     app.connect("build-finished", docinspect.finish)
+
+    # Results of parallel workers are merged by DocInspector.merge, so the build can
+    # be run on all cores with "sphinx-build -j auto".
+    return {
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+        "version": release,
+    }
@@ -26,25 +26,37 @@ you can just hit tab for autocompletion after the first "p" of "package.py". Mak
 faster typing. ;)
 """
 import argparse
-import glob
+import ast
+import bisect
+import fnmatch
+import functools
+import hashlib
 import importlib
+import importlib.util
 import inspect
 import io
 import json
 import math
-import multiprocessing
 import os
 import re
 import runpy
 import shutil
+import stat
+import textwrap
 import logging
 import sys
+import tomllib
 from contextlib import nullcontext, redirect_stdout, redirect_stderr
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 from urllib.parse import quote
 
+try:
+    import orjson  # Optional. Speeds up reading and writing json files considerably.
+except ImportError:
+    orjson = None
+
 
 class Settings:
     """
@@ -103,6 +115,11 @@ class Settings:
     # Directory in which documentation templates are stored.
     DOCUMENTATION_TEMPLATE_DIR = DOCUMENTATION_ROOT_DIR / "templates"
 
+    # File in which the results of the documentation inspection are cached between
+    # runs. It must not be placed in a directory that is removed before sphinx runs
+    # (e.g. the doctree directory). Only the remove command deletes it.
+    DOCUMENTATION_INSPECT_CACHE = BASE_DIR / ".docinspect_cache.json"
+
     # Directory in which build artifacts are placed.
     DISTRIBUTABLE_DIR = BASE_DIR / "dist"
 
@@ -166,6 +183,11 @@ class Settings:
     # The file in which bandit's results are stored (for parsing by package.py).
     SECURITY_BANDIT_JSON = TMP_DIR / "bandit.json"
 
+    # The file in which bandit's last results are cached together with a fingerprint
+    # of the analyzed source code. It is not placed in TMP_DIR, because that is removed
+    # after every run. Only the remove command deletes it.
+    SECURITY_BANDIT_CACHE = BASE_DIR / ".bandit_cache.json"
+
     # The file in which style violations are documented.
     STYLE_REPORT_JSON = TMP_DIR / "style.json"
 
@@ -209,6 +231,44 @@ class Settings:
     # number of issues <= key.
     SECURITY_ISSUES_THRESHOLDS = {0: "brightgreen"}
 
+    # *********************************************************
+    # *** This section specifies options for the used tools ***
+    # *********************************************************
+
+    # Additional arguments that make the tools use all CPU cores. The arguments are
+    # inserted before the ones given by the caller, unless the caller already passes
+    # the option itself.
+    TOOL_PARALLEL_FLAGS = {
+        "sphinx": ["-j", "auto"],
+        "flake8": ["--jobs", "auto"],
+        "isort": ["--jobs", str(os.cpu_count() or 1)],
+    }
+
+    # Modules that sphinx mocks instead of importing when documenting the package. The
+    # modules of installed dependencies are determined automatically. Add the import
+    # names of dependencies that are not installed in the documentation environment,
+    # e.g. "yaml" for PyYAML or "sklearn" for scikit-learn.
+    DOCUMENTATION_MOCK_IMPORTS = []
+
+
+def is_installed(modulename: str) -> bool:
+    """
+    Checks whether the given module can be imported without actually importing it.
+
+    Importing a module executes its top-level code, which can take a long time for
+    large packages. Finding the module is sufficient to know that it is available.
+
+    Args:
+        modulename: The name of the module, e.g. "jinja2".
+
+    Returns:
+        True, if the module is available. False, otherwise.
+    """
+    try:
+        return importlib.util.find_spec(modulename) is not None
+    except ModuleNotFoundError:
+        return False  # Parent package of a submodule is missing.
+
 
 def require(
     requirements: List[Tuple[str, Optional[str], Optional[List[str]]]],
@@ -227,7 +287,8 @@ def require(
             parameter is set to False.
 
     Returns:
-        True, if the given module is installed. False, otherwise.
+        The requirements that are not installed. If install is True, these are the
+        ones that could not be installed.
     """
 
     notinstalled = []
@@ -235,24 +296,27 @@ def require(
         modulename, packagename, options = requirement
         packagename = modulename if packagename is None else packagename
         options = [] if options is None else options
-        run = run_uv if has_uv() else pyexecute
 
-        try:
+        if is_installed(modulename):
+            continue
+
+        if install:
+            # Only look for uv when something needs to be installed, because it
+            # requires starting a process.
+            run = run_uv if has_uv() else pyexecute
+            cmd = (
+                ["pip", "install"] 
+                + options 
+                + [packagename] 
+                + ["--disable-pip-version-check"]
+            )
+            run(cmd)
+            # Make sure that the running script finds the new module.
             importlib.invalidate_caches()
-            importlib.import_module(modulename)
-        except ModuleNotFoundError:
-            if install:
-                cmd = (
-                    ["pip", "install"] 
-                    + options 
-                    + [packagename] 
-                    + ["--disable-pip-version-check"]
-                )
-                run(cmd)
-                # Make sure that the running script finds the new module.
-                importlib.invalidate_caches()
-            else:
+            if not is_installed(modulename):
                 notinstalled.append(requirement)
+        else:
+            notinstalled.append(requirement)
 
     return notinstalled
 
@@ -287,13 +351,18 @@ def remove_if_exists(path: Union[Path, str]):
         path: The path to the file or folder to delete.
     """
     try:
-        if os.path.isfile(str(path)):
-            os.remove(str(path))
-        if os.path.isdir(str(path)):
-            shutil.rmtree(str(path))
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return  # Nothing to delete.
+
+    try:
+        if stat.S_ISREG(mode):
+            os.remove(path)
+        elif stat.S_ISDIR(mode):
+            shutil.rmtree(path)
     except PermissionError as e:
         path = Path(path).absolute()
-        if os.path.isdir(str(path)):
+        if stat.S_ISDIR(mode):
             exit(f"Error while trying to delete folder \"{path}\":\n" + str(e))
         exit(f"Error while trying to delete file \"{path}\":\n" + str(e))
 
@@ -305,17 +374,118 @@ def remove_if_empty(path: Union[Path, str]):
     Args:
         path: The path to the folder that shall be deleted, if it is empty.
     """
-    if os.path.isdir(str(path)) and len(os.listdir(str(path))) == 0:
-        shutil.rmtree(str(path))
+    if os.path.isdir(path) and not os.listdir(path):
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass  # Another process has just added a file to or removed the folder.
 
 def file_has_content(path: Union[Path, str]):
-    if not os.path.isfile(str(path)):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         return False # File does not exist.
-    size = 0
-    with open(path, "r") as f:
-        f.seek(0, os.SEEK_END)
-        size = f.tell()
-    return size > 0 # Has the file any content?
+    return stat.S_ISREG(st.st_mode) and st.st_size > 0 # Has the file any content?
+
+
+def read_bytes(path: Union[Path, str]) -> bytes:
+    """
+    Reads the entire content of the given file.
+
+    The file is read using the size determined when opening it, which avoids the
+    additional system calls of buffered reading in chunks.
+
+    Args:
+        path: The path to the file to read.
+
+    Returns:
+        The content of the file.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        # Request one more byte than expected. Receiving exactly the expected amount
+        # means that the end of the file has been reached with a single read.
+        data = os.read(fd, size + 1)
+        if len(data) == size:
+            return data
+        # The file changed in the meantime or does not report its size.
+        chunks = [data]
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def write_if_changed(path: Union[Path, str], data: bytes) -> bool:
+    """
+    Writes the given data to a file, unless the file already has exactly that content.
+
+    Leaving unchanged files untouched keeps their modification time, so tools that
+    decide based on it do not consider them changed.
+
+    Args:
+        path: The path to the file to write.
+        data: The content to write.
+
+    Returns:
+        True, if the file has been written. False, if it was already up to date.
+    """
+    try:
+        # Only read the file, if the size already matches.
+        if os.stat(path).st_size == len(data) and read_bytes(path) == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def json_loads(buf: Union[bytes, str]):
+    """
+    Parses the given json document.
+
+    Uses orjson, if it is installed. The standard library is used otherwise.
+
+    Args:
+        buf: The json document.
+
+    Returns:
+        The parsed data.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid json.
+    """
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def json_dumps(data, indent: Optional[int] = None) -> bytes:
+    """
+    Serializes the given data to a utf-8 encoded json document.
+
+    Uses orjson, if it is installed. The standard library is used otherwise. Note
+    that orjson only supports an indentation of two spaces, which is used for any
+    given indentation.
+
+    Args:
+        data: The data to serialize.
+        indent: Number of spaces to indent nested elements with. The document is
+            written compactly, if None.
+
+    Returns:
+        The json document.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent is not None:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=indent).encode("utf-8")
 
 
 def mkdirs_if_not_exists(path: Union[str, Path]):
@@ -325,8 +495,52 @@ def mkdirs_if_not_exists(path: Union[str, Path]):
     Args:
         path: The folder path that shall be created.
     """
-    if not os.path.isdir(str(path)):
-        os.makedirs(str(path))
+    os.makedirs(path, exist_ok=True)
+
+
+def list_matching(directory: Union[Path, str], *patterns: str) -> List[str]:
+    """
+    Returns the paths of all entries of a directory matching any of the patterns.
+
+    In contrast to calling glob.glob once per pattern, the directory is only read once.
+    Like glob, hidden entries are skipped.
+
+    Args:
+        directory: The directory to search.
+        patterns: Shell-style wildcard patterns (e.g. "*.egg-info") the entry names
+            are matched against.
+
+    Returns:
+        List of matching paths. Empty, if the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [
+                entry.path
+                for entry in it
+                if not entry.name.startswith(".")
+                and any(fnmatch.fnmatch(entry.name, p) for p in patterns)
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+@functools.lru_cache(maxsize=1024)
+def relative_path(filename: str, cwd: str) -> str:
+    """
+    Returns the given path relative to the given working directory.
+
+    Reports refer to the same files over and over again, so the result is cached per
+    pair of filename and working directory.
+
+    Args:
+        filename: The absolute path or the path relative to cwd.
+        cwd: The current working directory as returned by os.getcwd().
+
+    Returns:
+        The path relative to the working directory.
+    """
+    return os.path.relpath(os.path.join(cwd, filename), cwd)
 
 
 def get_program_path(prog: str):
@@ -342,6 +556,24 @@ def get_program_path(prog: str):
         return None
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_module_path(name: str) -> Path:
+    """
+    Returns the path to the file that is executed when running the given module.
+
+    The result is cached, because resolving the module requires searching sys.path.
+
+    Args:
+        name: The name of the module, e.g. "pip" or "sphinx.ext.apidoc".
+
+    Returns:
+        The path to the module's __main__.py file for packages or to the module file
+        itself otherwise.
+    """
+    path = get_program_path(name)  # type: ignore
+    return path.parents[0] / "__main__.py" if path.name == "__init__.py" else path
+
+
 def run_uv(args: list) -> bool:
     """
     Runs a command using uv package manager.
@@ -359,6 +591,7 @@ def run_uv(args: list) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def has_uv():
     """ Returns True, if uv package manager is available. False, otherwise. """
     from subprocess import run, CalledProcessError, DEVNULL
@@ -371,6 +604,40 @@ def has_uv():
         return False    
     
 
+def _tool_arguments(cmd: list) -> list:
+    """
+    Returns the arguments for the tool given as first entry of the command.
+
+    Args:
+        cmd: The command to run as given to runner().
+
+    Returns:
+        The arguments given in the command (excluding the tool itself) with the tool's
+        parallelization options from Settings.TOOL_PARALLEL_FLAGS prepended.
+    """
+    flags = Settings.TOOL_PARALLEL_FLAGS.get(cmd[0], [])
+    if flags and flags[0] not in cmd[1:]:
+        return list(flags) + cmd[1:]
+    return cmd[1:]
+
+
+def _output_context(tool: str):
+    """
+    Returns the context manager for silencing the output of the given tool.
+
+    Args:
+        tool: The name of the tool's module.
+
+    Returns:
+        A context manager that silences findings and error messages of the tool.
+    """
+    # Silence findings except for pip and uv.
+    cxt = nullcontext() if tool in ["pip", "uv"] else redirect_stdout(io.StringIO())
+    # Silence error messages for tools that output findings on stderr although they
+    # are part of normal operation.
+    return redirect_stderr(io.StringIO()) if tool in ["mypy"] else cxt
+
+
 def runner(cmd: list):
     """
     Runs a module in a separate process.
@@ -383,33 +650,145 @@ def runner(cmd: list):
     # Create the list of arguments to provide to the executed module. For this, obtain
     # the file path for the module and set it as first argument, then copy the remaining
     # arguments as they are to the argument list.
-    path = get_program_path(cmd[0])  # type: ignore
-    apppath = path.parents[0] / "__main__.py" if path.name == "__init__.py" else path
+    apppath = _resolve_module_path(cmd[0])
     arguments = list([str(apppath)])
-    arguments += cmd[1:]
+    arguments += _tool_arguments(cmd)
 
     # Provide arguments to the module and run the module.
     sys.argv = arguments
 
     # Run module and silence error messages as well as findings except for pip and uv.
-    cxt = nullcontext() if cmd[0] in ["pip", "uv"] else redirect_stdout(io.StringIO())
-    # Silence error messages for tools that output findings on stderr although they
-    # are part of normal operation. 
-    cxt = redirect_stderr(io.StringIO()) if cmd[0] in ["mypy"] else cxt
-
-    with cxt:
+    with _output_context(cmd[0]):
         try:
             runpy.run_module(cmd[0], run_name="__main__")
         except Exception as e:
             print(f"Running command {' '.join(cmd)} failed:\n{str(e)}")
 
 
+def _run_isort(args: list) -> int:
+    """
+    Runs isort using its Python API.
+
+    Args:
+        args: The command line arguments for isort.
+
+    Returns:
+        The exit code of isort.
+    """
+    from isort.main import main
+
+    main(args)
+    return 0
+
+
+def _run_black(args: list) -> int:
+    """
+    Runs black using its Python API.
+
+    Args:
+        args: The command line arguments for black.
+
+    Returns:
+        The exit code of black.
+    """
+    import black
+
+    return black.main.main(args=args, standalone_mode=False) or 0
+
+
+def _run_flake8(args: list) -> int:
+    """
+    Runs flake8 using its Python API.
+
+    Args:
+        args: The command line arguments for flake8.
+
+    Returns:
+        The exit code of flake8.
+    """
+    from flake8.main.cli import main
+
+    return main(args)
+
+
+def _run_mypy(args: list) -> int:
+    """
+    Runs mypy using its Python API.
+
+    Args:
+        args: The command line arguments for mypy.
+
+    Returns:
+        The exit code of mypy.
+    """
+    from mypy import api
+
+    return api.run(args)[2]
+
+
+def _run_apidoc(args: list) -> int:
+    """
+    Runs sphinx-apidoc using its Python API.
+
+    Args:
+        args: The command line arguments for sphinx-apidoc.
+
+    Returns:
+        The exit code of sphinx-apidoc.
+    """
+    from sphinx.ext.apidoc import main
+
+    return main(args)
+
+
+# Tools that provide a stable Python API and only analyze or format the source code
+# without importing it. They are run in the current process to avoid the cost of
+# starting a new interpreter and importing the tool each time. All other tools are run
+# in a separate process. This includes the sphinx build, because autodoc imports the
+# documented package, which must not end up in (and stay in) this process.
+TOOL_ENTRYPOINTS = {
+    "isort": _run_isort,
+    "black": _run_black,
+    "flake8": _run_flake8,
+    "mypy": _run_mypy,
+    "sphinx.ext.apidoc": _run_apidoc,
+}
+
+
+def _inprocess(cmd: list) -> int:
+    """
+    Runs the given command in the current process using the tool's Python API.
+
+    Args:
+        cmd: The command to run. First entry must be a key of TOOL_ENTRYPOINTS.
+
+    Returns:
+        The exit code of the tool.
+    """
+    argv = sys.argv
+    sys.argv = [cmd[0]] + _tool_arguments(cmd)
+
+    try:
+        with _output_context(cmd[0]):
+            return TOOL_ENTRYPOINTS[cmd[0]](_tool_arguments(cmd))
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return int(e.code) if isinstance(e.code, int) else 1
+    except Exception as e:
+        print(f"Running command {' '.join(cmd)} failed:\n{str(e)}")
+        return 1
+    finally:
+        sys.argv = argv
+
+
 def pyexecute(cmd: list):
     """
     Runs shell commands in a more secure way.
 
     Shell commands are executed using the absolute python path with which the script
-    was started.
+    was started. Tools listed in TOOL_ENTRYPOINTS are run in the current process
+    instead.
 
     Args:
         cmd: Command to execute as a list of arguments.
@@ -423,6 +802,11 @@ def pyexecute(cmd: list):
             + f"Instead got {type(cmd).__name__}."
         )
 
+    if cmd[0] in TOOL_ENTRYPOINTS:
+        return _inprocess(cmd)
+
+    import multiprocessing
+
     p = multiprocessing.Process(
         target=runner,
         args=(cmd,)
@@ -432,6 +816,226 @@ def pyexecute(cmd: list):
     return p.exitcode
 
 
+@functools.lru_cache
+def _report_environment(templatedir: str):
+    """
+    Returns the jinja environment for the report templates in the given directory.
+
+    The environment is cached, so that each process compiles a template only once.
+    In addition, compiled templates are stored in jinja's cache directory in the
+    system's temporary folder, so that subsequent runs do not need to parse them again.
+
+    Args:
+        templatedir: The directory containing the report templates.
+
+    Returns:
+        The jinja environment.
+    """
+    import jinja2
+
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(templatedir),
+        autoescape=True,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _read_lines(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """
+    Returns the lines of the given UTF-8 encoded text file.
+
+    Reports often show many snippets of the same file, e.g. one for each finding. The
+    result is cached, so that the file is read only once. Modification time and size
+    are part of the cache key, so that a modified file is read again.
+
+    Args:
+        path: The path to the file.
+        mtime_ns: The modification time of the file in nanoseconds.
+        size: The size of the file in bytes.
+
+    Returns:
+        The lines of the file including line breaks. Contains a single empty line, if
+        the file is empty.
+    """
+    # Unlike str.splitlines(), readlines() only splits at line breaks that tools
+    # count as such, which keeps line numbers consistent.
+    with open(path, "r", encoding="utf-8") as f:
+        return tuple(f.readlines()) or ("",)
+
+
+def _render_report_file(templatedir: str, filename: str, context: dict) -> None:
+    """
+    Renders a report file containing code snippets and writes it to the given file.
+
+    Args:
+        templatedir: The directory containing the report templates.
+        filename: The path of the HTML file to write.
+        context: The variables to pass to the file template.
+    """
+    environment = _report_environment(templatedir)
+    template = environment.get_template("file.jinja")
+    # Stream the output to the file instead of rendering it as a whole into memory.
+    template.stream(**context).dump(filename, encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parameter_names(subject: object) -> Tuple[str, ...]:
+    """
+    Returns the names of the parameters of the given callable.
+
+    DocInspector looks at the signature of each object several times and
+    inspect.signature() is comparatively slow, so the result is cached.
+
+    Args:
+        subject: The callable to get the parameter names of.
+
+    Returns:
+        The parameter names in order of definition.
+    """
+    return tuple(inspect.signature(subject).parameters.keys())
+
+
+@functools.lru_cache(maxsize=4096)
+def _source_file(subject: object) -> Optional[str]:
+    """
+    Returns the name of the source file the given object has been defined in.
+
+    DocInspector needs the file of each object several times, so the result of
+    inspect.getsourcefile() is cached.
+
+    Args:
+        subject: The module, class, method or function to get the source file of.
+
+    Returns:
+        The path to the source file or None, if it cannot be determined.
+    """
+    return inspect.getsourcefile(subject)  # type: ignore
+
+
+@functools.lru_cache(maxsize=4096)
+def _source_lines(subject: object) -> Tuple[Tuple[str, ...], int]:
+    """
+    Returns the source code of the given object and the line it starts at.
+
+    DocInspector needs the source code of each object several times and
+    inspect.getsourcelines() searches the whole file for it, so the result is cached.
+
+    Args:
+        subject: The module, class, method or function to get the source code of.
+
+    Returns:
+        Tuple consisting of the source code lines (including line breaks) and the
+        number of the first line.
+    """
+    lines, lineno = inspect.getsourcelines(subject)  # type: ignore
+    return tuple(lines), lineno
+
+
+@functools.lru_cache(maxsize=64)
+def _function_nodes(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Returns the function definitions in the given Python file.
+
+    The result is cached, so that the file is parsed only once, no matter how many of
+    its functions need it. Modification time and size are part of the cache key, so
+    that a modified file is parsed again.
+
+    Args:
+        path: The path to the Python file.
+        mtime_ns: The modification time of the file in nanoseconds.
+        size: The size of the file in bytes.
+
+    Returns:
+        Dictionary mapping the first line of each function definition (including
+        decorators, like inspect.getsourcelines()) to its syntax tree node.
+
+    Raises:
+        SyntaxError: If the file cannot be parsed.
+    """
+    tree = ast.parse("".join(_read_lines(path, mtime_ns, size)), path)
+    nodes = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            lines = [node.lineno] + [d.lineno for d in node.decorator_list]
+            nodes[min(lines)] = node
+    return nodes
+
+
+# True in the worker processes of run_checks(). These share the directory for
+# temporary files, so a worker must not remove it while others write into it.
+_in_check_worker = False
+
+
+def _init_check_worker() -> None:
+    """
+    Marks the current process as a worker process of run_checks().
+    """
+    global _in_check_worker
+    _in_check_worker = True
+
+
+def remove_tmp_if_empty(path: Union[Path, str]):
+    """
+    Deletes the folder for temporary files, if it is empty.
+
+    Does nothing in the worker processes of run_checks(), because other checks may be
+    about to write into the folder. The main process removes it during clean up.
+
+    Args:
+        path: The path to the folder for temporary files.
+    """
+    if not _in_check_worker:
+        remove_if_empty(path)
+
+
+def _run_check(check):
+    """
+    Runs the given check.
+
+    Args:
+        check: The check to run, e.g. an instance of TypeCheck.
+
+    Returns:
+        Tuple consisting of the result of the check's run() method and the check
+        itself, which holds the state needed for reporting afterwards.
+    """
+    return check.run(), check
+
+
+def run_checks(checks: list, tmpdir: Union[Path, str]) -> list:
+    """
+    Runs multiple independent checks in parallel, each in a separate process.
+
+    Only pass checks that neither modify the source code nor use each other's files.
+    For example, the style check must not be run in parallel, because it reformats
+    the source code that the other checks analyze.
+
+    Args:
+        checks: The checks to run, e.g. instances of TypeCheck and Test.
+        tmpdir: The folder for temporary files. It is created once beforehand, because
+            the checks write into it concurrently.
+
+    Returns:
+        List of tuples in the same order as the given checks. Each tuple consists of
+        the result of the check's run() method and the check after running it. The
+        latter must replace the given check, because the run took place in another
+        process.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    mkdirs_if_not_exists(tmpdir)
+
+    if len(checks) < 2 or (os.cpu_count() or 1) < 2:
+        return [_run_check(check) for check in checks]
+
+    with ProcessPoolExecutor(
+        max_workers=len(checks), initializer=_init_check_worker
+    ) as executor:
+        futures = [executor.submit(_run_check, check) for check in checks]
+        return [future.result() for future in futures]
+
+
 class Report:
     """
     Generates an HTML report.
@@ -450,6 +1054,10 @@ class Report:
     SUMMARY_UNIT = "unit"
     SUMMARY_PASSED = "passed"
 
+    # Minimum number of code snippet files for rendering them in parallel. Below that,
+    # starting the worker processes takes longer than rendering the files.
+    PARALLEL_RENDER_MIN_FILES = 16
+
     class List:
         """
         Models a list of elements in the final report, e.g. a list of security issues.
@@ -487,18 +1095,7 @@ class Report:
             """
             Allows the class to be used as an iterable.
             """
-            self.index = 0
-            return self
-
-        def __next__(self):
-            """
-            Allows the class to be used as an iterable.
-            """
-            if self.index < len(self.entries):
-                self.index += 1
-                return self.entries[self.index - 1]
-            else:
-                raise StopIteration
+            return iter(self.entries)
 
         @property
         def count(self):
@@ -550,18 +1147,7 @@ class Report:
             """
             Allows the class to be used as an iterable.
             """
-            self.index = 0
-            return self
-
-        def __next__(self):
-            """
-            Allows the class to be used as an iterable.
-            """
-            if self.index < len(self.entries):
-                self.index += 1
-                return self.entries[self.index - 1]
-            else:
-                raise StopIteration
+            return iter(self.entries)
 
         @property
         def count(self):
@@ -593,14 +1179,16 @@ class Report:
         assigned to each category using the set_mark_name method.
         """
 
-        CONTENT = "content"
-        COLOR = "color"
-
         COLOR_GOOD = "good"
         COLOR_BAD = "bad"
         COLOR_NEUTRAL = "neutral"
         COLOR_NONE = "none"
 
+        # Color categories in the order of their codes. The color of each line is
+        # stored as one byte holding the index into this tuple.
+        COLORS = (COLOR_NONE, COLOR_GOOD, COLOR_BAD, COLOR_NEUTRAL)
+        COLOR_CODES = {color: code for code, color in enumerate(COLORS)}
+
         def __init__(self, filepath: str) -> None:
             """
             Initializes the object with the path to the file that shall be shown.
@@ -613,18 +1201,25 @@ class Report:
             self.filepath = filepath
             self.outputpath = ""
             self.colorname = {}
-            self.lines = []
             self.__range = tuple()
 
-            with open(filepath, "r") as f:
-                self.lines = [
-                    {self.CONTENT: line, self.COLOR: self.COLOR_NONE}
-                    for line in f
-                    if line
-                ]
-                if not self.lines:
-                    self.lines = [{self.CONTENT: "", self.COLOR: self.COLOR_NONE}]
-                self.__range = (0, len(self.lines))
+            # Content and color of the lines are kept in two separate sequences
+            # instead of one dictionary per line to save memory. The content is shared
+            # by all instances showing the same file. Only the colors are per instance.
+            st = os.stat(filepath)
+            self._content = _read_lines(str(filepath), st.st_mtime_ns, st.st_size)
+            self._color = bytearray(len(self._content))
+            self.__range = (0, len(self._content))
+
+        @property
+        def lines(self):
+            """
+            Returns the content and color category of each line.
+
+            Returns:
+                Iterator over (content, color) tuples, one for each line.
+            """
+            return zip(self._content, map(self.COLORS.__getitem__, self._color))
 
         @property
         def range(self):
@@ -634,7 +1229,7 @@ class Report:
         @range.setter
         def range(self, range: Tuple):
             """Sets the range of lines to display."""
-            self.__range = (max(0, range[0]), min(len(self.lines), range[1]))
+            self.__range = (max(0, range[0]), min(len(self._content), range[1]))
 
         @property
         def heading(self):
@@ -666,12 +1261,7 @@ class Report:
                     legend that the report provides.
 
             """
-            if marking not in [
-                self.COLOR_GOOD,
-                self.COLOR_BAD,
-                self.COLOR_NEUTRAL,
-                self.COLOR_NONE,
-            ]:
+            if marking not in self.COLOR_CODES:
                 raise ValueError("Invalid marking type.")
             self.colorname[marking] = label
 
@@ -699,28 +1289,25 @@ class Report:
             if not inlines:
                 return
 
-            if marking not in [
-                self.COLOR_GOOD,
-                self.COLOR_BAD,
-                self.COLOR_NEUTRAL,
-                self.COLOR_NONE,
-            ]:
+            if marking not in self.COLOR_CODES:
                 raise ValueError("Invalid marking type.")
 
+            code = self.COLOR_CODES[marking]
+            count = len(self._content)
             for linenumber in inlines:
-                if linenumber > len(self.lines) or linenumber < 1:
+                if not 1 <= linenumber <= count:
                     raise ValueError(
                         "Invalid line number for "
                         + self.filepath
                         + ": "
                         + str(linenumber)
                         + ". Line number must be within 1 to "
-                        + str(len(self.lines) + 1)
+                        + str(count + 1)
                         + "."
                     )
 
                 # First line starts with 1 and not 0.
-                self.lines[linenumber - 1][self.COLOR] = marking
+                self._color[linenumber - 1] = code
 
         def identifier(self):
             """
@@ -738,9 +1325,13 @@ class Report:
             filepath = str(Path(self.filepath).absolute())
             range = self.__range
             range = f"{range[0]:08d}{range[1]:08d}" if range else "None"
-            color = [f"{i:08d}" + line[self.COLOR] for i, line in enumerate(self.lines)]
-            color = "".join(color)
-            return hash(filepath + range + color)
+
+            # Feed the hash line by line instead of building one large string.
+            fingerprint = hashlib.blake2b(digest_size=16)
+            fingerprint.update(filepath.encode("utf-8") + b"\0")
+            fingerprint.update(range.encode("utf-8"))
+            fingerprint.update(self._color)
+            return fingerprint.hexdigest()
 
     @classmethod
     def get_requirements(cls, settings: Settings):
@@ -768,14 +1359,11 @@ class Report:
         self._settings = settings
 
         if self.active:
-            import jinja2
             self._timestamp = datetime.now().astimezone()
-            self._environment = jinja2.Environment(
-                loader=jinja2.FileSystemLoader(str(self._settings.REPORT_TEMPLATE_DIR)),
-                autoescape=True,
+            self._environment = _report_environment(
+                str(self._settings.REPORT_TEMPLATE_DIR)
             )
             self._maintemplate = self._environment.get_template("main.jinja")
-            self._filetemplate = self._environment.get_template("file.jinja")
 
     def render(self):
         """
@@ -794,39 +1382,45 @@ class Report:
         mkdirs_if_not_exists(self._settings.REPORT_FILES_DIR)
 
         # Copy style sheets to output directory.
-        for f in glob.glob(str(self._settings.REPORT_TEMPLATE_DIR / "*.css")):
-            shutil.copy(f, self._settings.REPORT_FILES_DIR)
+        with os.scandir(self._settings.REPORT_TEMPLATE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".css") and entry.is_file():
+                    shutil.copy(entry.path, self._settings.REPORT_FILES_DIR)
 
         styledir = self._settings.REPORT_FILES_DIR.absolute()
 
-        filelist = [str(self._settings.REPORT_HTML.absolute())]
+        filelist = {str(self._settings.REPORT_HTML.absolute())}
         # Write main report file.
-        with open(self._settings.REPORT_HTML, "wb") as f:
-            output = self._maintemplate.render(
+        self._maintemplate.stream(
+            appname=self._appname,
+            version=self._version,
+            timestamp=self._timestamp,
+            report=self._sections,
+            summary={heading: self.summary(heading) for heading in self._sections},
+            style_dir=os.path.relpath(styledir, outputdir.absolute()),
+        ).dump(str(self._settings.REPORT_HTML), encoding="utf-8")
+
+        # Write files containing code snippets.
+        # All of them are typically placed in the same folder, so compute the path of
+        # the style sheets relative to each folder only once.
+        outputroot = str(outputdir.absolute())
+        relstyledirs = {}
+        jobs = []
+        for file in self._files.values():
+            filename = os.path.join(outputroot, file.outputpath)
+            filedir = os.path.dirname(filename)
+            if filedir not in relstyledirs:
+                relstyledirs[filedir] = os.path.relpath(styledir, filedir)
+            filelist.add(filename)
+            context = dict(
                 appname=self._appname,
                 version=self._version,
                 timestamp=self._timestamp,
-                report=self._sections,
-                summary={heading: self.summary(heading) for heading in self._sections},
-                style_dir=os.path.relpath(styledir, outputdir.absolute()),
+                file=file,
+                style_dir=relstyledirs[filedir],
             )
-            f.write(output.encode("utf-8"))
-
-        # Write files containing code snippets.
-        for file in self._files.values():
-            filename = (outputdir / Path(file.outputpath)).absolute()
-            filedir = filename.parent
-            filelist.append(str(filename.absolute()))
-            with open(filename, "wb") as f:
-                output = self._filetemplate.render(
-                    appname=self._appname,
-                    version=self._version,
-                    timestamp=self._timestamp,
-                    file=file,
-                    style_dir=os.path.relpath(styledir, filedir.absolute()),
-                )
-                f.write(output.encode("utf-8"))
-                f.close()
+            jobs.append((filename, context))
+        self._render_files(jobs)
 
         # Remove report files that are not needed anymore.
         # Although one could just remove the entire report folder, it is easier to
@@ -834,9 +1428,39 @@ class Report:
         # the report opened in a browser. The user then just needs to refresh the page.
         # Deleting the folder is not allowed when the report has been opened in a
         # browser, because the file is then denoted as "in use by another process".
-        for existing in glob.glob(str(self._settings.REPORT_FILES_DIR / "*.html")):
-            if str(Path(existing).absolute()) not in filelist:
-                remove_if_exists(existing)
+        with os.scandir(self._settings.REPORT_FILES_DIR.absolute()) as entries:
+            for entry in entries:
+                if entry.name.endswith(".html") and entry.path not in filelist:
+                    remove_if_exists(entry.path)
+
+    def _render_files(self, jobs: list):
+        """
+        Renders the report files containing code snippets.
+
+        The files are independent of each other, so they are rendered in parallel if
+        there are enough of them to make up for the cost of starting the processes.
+
+        Args:
+            jobs: List of tuples, each consisting of the output filename and the
+                variables to pass to the file template.
+        """
+        templatedir = str(self._settings.REPORT_TEMPLATE_DIR)
+        workers = min(len(jobs), os.cpu_count() or 1)
+
+        if len(jobs) < self.PARALLEL_RENDER_MIN_FILES or workers < 2:
+            for filename, context in jobs:
+                _render_report_file(templatedir, filename, context)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_render_report_file, templatedir, filename, context)
+                for filename, context in jobs
+            ]
+            for future in futures:
+                future.result()  # Propagate exceptions raised while rendering.
 
     def add(self, section: str, data: Union[File, Table, List]):
         """
@@ -898,7 +1522,7 @@ class Report:
             }
         return {
             self.SUMMARY_NAME: "Issues",
-            self.SUMMARY_VALUE: sum([entry.count for entry in self._sections[section]]),
+            self.SUMMARY_VALUE: sum(entry.count for entry in self._sections[section]),
             self.SUMMARY_UNIT: "",
         }
 
@@ -937,6 +1561,12 @@ class Meta:
     automatic configuration.
     """
 
+    TABLE_PROJECT = "project"
+
+    # Parsed config files shared by all instances. Maps the path of a config file to
+    # a tuple of (modification time, size) and the parsed content.
+    _PARSED: dict = {}
+
     def __init__(self, configfile: Union[Path, str]):
         """
         Initializes the build with the package name from config file.
@@ -945,7 +1575,40 @@ class Meta:
             configfile: The name of the config file to pull the package
                 name from.
         """
-        self.configfile = str(configfile)
+        self.configfile = os.path.abspath(configfile)
+
+    @property
+    def _data(self) -> dict:
+        """
+        Returns the parsed content of the config file.
+
+        The file is parsed only once, even if several instances read the same file.
+        It is parsed again only if it has been modified in the meantime, e.g. because
+        the version has been bumped.
+
+        Returns:
+            Dictionary with the content of the config file.
+        """
+        st = os.stat(self.configfile)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._PARSED.get(self.configfile)
+
+        if cached is None or cached[0] != stamp:
+            with open(self.configfile, "rb") as f:
+                cached = (stamp, tomllib.load(f))
+            self._PARSED[self.configfile] = cached
+
+        return cached[1]
+
+    def _project(self) -> dict:
+        """
+        Returns the project table of the config file.
+
+        Returns:
+            Dictionary with the content of the project table. Empty, if the config
+            file does not have one.
+        """
+        return self._data.get(self.TABLE_PROJECT, {})
 
     def get(self, keyword: str):
         """
@@ -957,19 +1620,12 @@ class Meta:
         Returns:
             The value in the config file stored under the given key.
         """
+        project = self._project()
 
-        with open(self.configfile, "r", encoding="utf8") as f:
-            regex = r"[ ]*=[ ]*\"([^\n]+)?((\n[ \t]+([^\n]+))*)\""
-            buf = f.read()
-            match = re.search(keyword + regex, buf)
+        if keyword not in project:
+            raise LookupError(f'Could not determine "{keyword}".')
 
-            if match is None:
-                raise LookupError(f'Could not determine "{keyword}".')
-
-            matchstr = (match.group(1) or "") + (match.group(2) or "")
-            lines = matchstr.split("\n")
-            out = [entry.strip() for entry in lines if entry.strip()]
-            return out if len(out) > 1 else out[0]
+        return project[keyword]
 
     def getAuthors(self):
         """
@@ -978,18 +1634,23 @@ class Meta:
         Returns:
             The names of all authors.
         """
+        authors = self._project().get("authors")
 
-        with open(self.configfile, "r", encoding="utf8") as f:
-            buf = f.read()
-            match = re.search(r"authors[ ]*=[ ]*\[.*?\]", buf, flags=re.MULTILINE | re.DOTALL)
+        if authors is None:
+            raise LookupError(f'Could not determine authors.')
 
-            if match is None:
-                raise LookupError(f'Could not determine authors.')
+        # Remove duplicates while keeping the order given in the config file.
+        return list(dict.fromkeys(a["name"] for a in authors if "name" in a))
 
-            matchstr = match.group(0)
-            names = list(set(re.findall(r"name[ ]*=[ ]*\"([^\"]+)", matchstr)))
-            return names
+    def getDependencies(self):
+        """
+        Returns the requirement specifiers of all dependencies.
 
+        Returns:
+            The requirement specifiers as given in the config file, e.g.
+            "requests[security] < 3". An empty list, if there are no dependencies.
+        """
+        return list(self._project().get("dependencies", []))
 
     def getCopyright(self):
         """
@@ -998,8 +1659,6 @@ class Meta:
         Returns:
             String with copyright notice.
         """
-        from datetime import timezone
-
         date = datetime.now(timezone.utc)
         return str(date.year) + ", " + ", ".join(self.getAuthors())
 
@@ -1028,8 +1687,28 @@ class AbsBadge:
         meta = Meta(settings.CONFIGFILE)
         self._readmefilename = meta.get("readme")
         self._rel_abs_map = dict()
-        with open(self._readmefilename, "r") as file:
-            self._readme = file.read()
+        self._pending = dict()
+        self._readme = Path(self._readmefilename).read_text(encoding="utf-8")
+
+    @staticmethod
+    @functools.lru_cache
+    def _link_stem(title: str) -> Tuple[str, re.Pattern]:
+        """
+        Returns the start of the shields.io link for the badge with the given title.
+
+        The result is cached, so that the regular expression for a badge title is
+        compiled only once.
+
+        Args:
+            title: The title of the badge.
+
+        Returns:
+            Tuple consisting of the link stem and a compiled regular expression matching
+            a markdown link target that starts with the link stem.
+        """
+        link_stem = f"https://img.shields.io/static/v1?label={quote(title)}&message="
+        link_regex = re.compile(r"\([ ]*" + re.escape(link_stem) + r"[^\)]*?[ ]*\)")
+        return link_stem, link_regex
 
     def replace_badge(self, badgefile: str, title: str, text: str, color: str) -> None:
         """
@@ -1042,37 +1721,105 @@ class AbsBadge:
             color: The color the badge shall have.
         """
 
-        link_stem = f"https://img.shields.io/static/v1?label={quote(title)}&message="
+        link_stem, link_regex = self._link_stem(title)
         link = link_stem + f"{quote(text)}&color={quote(color)}"
-        # Replace address, if shields.io badge is used.
-        link_regex = r"\([ ]*" + re.escape(link_stem) + r"[^\)]*?[ ]*\)"
-        badgefile_left = badgefile.replace("/", "\\")
         badgefile_right = badgefile.replace("\\", "/")
-        self._rel_abs_map[badgefile_right] = link_regex
+        self._rel_abs_map[badgefile_right] = (link_stem, link_regex)
+        # The readme is only updated once all badges are known. See _apply_pending.
+        self._pending[badgefile_right] = (link_stem, link_regex, link)
+
+    def _apply_pending(self):
+        """
+        Applies all badge replacements requested since the last call to the readme.
+
+        Instead of scanning the readme once for each badge, all replacements are
+        combined into a single regular expression, so that the readme is scanned once.
+        """
+        alternatives = []
+        replacements = []
+
+        for badgefile_right, (link_stem, link_regex, link) in self._pending.items():
+            badgefile_left = badgefile_right.replace("/", "\\")
+            if badgefile_right in self._readme or badgefile_left in self._readme:
+                # Replace static badge file independent of slash direction.
+                patterns = [re.escape(badgefile_left), re.escape(badgefile_right)]
+                replacement = link
+            elif link_stem in self._readme:
+                # Replace address, if shields.io badge is used.
+                patterns = [link_regex.pattern]
+                replacement = f"({link})"
+            else:
+                continue
 
-        if badgefile_right in self._readme or badgefile_left in self._readme:
-            # Replace static badge file independent of slash direction.
-            self._readme = self._readme.replace(badgefile_left, link)
-            self._readme = self._readme.replace(badgefile_right, link)
-        else:
-            self._readme = re.sub(link_regex, f"({link})", self._readme)
+            for pattern in patterns:
+                alternatives.append(f"(?P<g{len(replacements)}>{pattern})")
+                replacements.append(replacement)
+
+        self._pending.clear()
+
+        if not alternatives:
+            return
+
+        regex = re.compile("|".join(alternatives))
+        self._readme = regex.sub(
+            lambda match: replacements[int(match.lastgroup[1:])], self._readme
+        )
 
     def write_absolute_readme(self):
         """
         Replaces the readme file with a version that uses shields.io badges.
         """
-        with open(self._readmefilename, "w") as file:
-            file.write(self._readme)
+        self._apply_pending()
+        Path(self._readmefilename).write_text(self._readme, encoding="utf-8")
 
     def write_relative_readme(self):
         """
         Replaces the readme file with a version that uses local badge files.
         """
-        for badgefile, link_regex in self._rel_abs_map.items():
-            self._readme = re.sub(link_regex, f"({badgefile})", self._readme)
+        self._apply_pending()
+        for badgefile, (link_stem, link_regex) in self._rel_abs_map.items():
+            if link_stem in self._readme:
+                self._readme = link_regex.sub(f"({badgefile})", self._readme)
+
+        Path(self._readmefilename).write_text(self._readme, encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=128)
+def _render_badge(left_text: str, right_text: str, right_color: str) -> str:
+    """
+    Renders a badge as SVG.
+
+    The result is cached, because the same badge is often rendered several times,
+    e.g. the build badge before and after building.
+
+    Args:
+        left_text: The text on the left side of the badge, i.e. its title.
+        right_text: The text on the right side of the badge, i.e. its message.
+        right_color: The color of the right side of the badge.
+
+    Returns:
+        The SVG data of the badge.
+    """
+    import pybadges
+
+    return pybadges.badge(
+        left_text=left_text, right_text=right_text, right_color=right_color
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _sorted_thresholds(items: tuple) -> Tuple[list, list]:
+    """
+    Sorts the given thresholds for looking them up with bisect.
 
-        with open(self._readmefilename, "w") as file:
-            file.write(self._readme)
+    Args:
+        items: Tuple of (threshold, color) pairs.
+
+    Returns:
+        Tuple consisting of the sorted thresholds and their colors in the same order.
+    """
+    ordered = sorted(items, key=lambda item: item[0])
+    return [k for k, _ in ordered], [v for _, v in ordered]
 
 
 class Badge:
@@ -1111,6 +1858,7 @@ class Badge:
         """
         self._settings = settings
         self._absbadge = AbsBadge(settings)
+        self._badgefolder = os.path.normpath(settings.BADGE_FOLDER)
         self.active = True
 
     def get_badgefile(self, badgename: str) -> str:
@@ -1125,8 +1873,7 @@ class Badge:
             File path to the badge's svg file.
         """
         filename = badgename.replace(" ", "_")
-        badgefolder = os.path.normpath(self._settings.BADGE_FOLDER)
-        return str(Path(badgefolder) / f"{filename}.svg")
+        return os.path.join(self._badgefolder, f"{filename}.svg")
 
     def _write(self, badgefile: str, data: str):
         """
@@ -1157,8 +1904,9 @@ class Badge:
         Returns:
             Color string for the badge packages the matches the given value.
         """
-        applicable = [k for k in thresholddict.keys() if value >= k]
-        return str(thresholddict[max(applicable)]) if applicable else "red"
+        keys, colors = _sorted_thresholds(tuple(thresholddict.items()))
+        index = bisect.bisect_right(keys, value) - 1
+        return str(colors[index]) if index >= 0 else "red"
 
     def _getThresholdColorLTE(self, thresholddict: dict, value: float) -> str:
         """
@@ -1176,8 +1924,9 @@ class Badge:
         Returns:
             Color string for the badge packages the matches the given value.
         """
-        applicable = [k for k in thresholddict.keys() if value <= k]
-        return str(thresholddict[min(applicable)]) if applicable else "red"
+        keys, colors = _sorted_thresholds(tuple(thresholddict.items()))
+        index = bisect.bisect_left(keys, value)
+        return str(colors[index]) if index < len(keys) else "red"
 
     def get_coverage_badge_data(self, title: str, value: float, thresholds: dict):
         """
@@ -1246,13 +1995,9 @@ class Badge:
         if not self.active:
             print(f"Skipping coverage badge.")
             return
-        
-        import pybadges
 
         badge_data = self.get_coverage_badge_data(title, value, thresholds)
-        data = pybadges.badge(
-            left_text=badge_data[0], right_text=badge_data[1], right_color=badge_data[2]
-        )
+        data = _render_badge(*badge_data)
 
         badgefile = self.get_badgefile(title)
         self._absbadge.replace_badge(badgefile, *badge_data)
@@ -1270,14 +2015,9 @@ class Badge:
         if not self.active:
             print(f"Skipping issue badge.")
             return
-        
-        import pybadges
 
         badge_data = self.get_issue_badge_data(title, value, thresholds)
-
-        data = pybadges.badge(
-            left_text=badge_data[0], right_text=badge_data[1], right_color=badge_data[2]
-        )
+        data = _render_badge(*badge_data)
         badgefile = self.get_badgefile(title)
         self._absbadge.replace_badge(badgefile, *badge_data)
         self._write(badgefile, data)
@@ -1296,13 +2036,9 @@ class Badge:
         if not self.active:
             print(f"Skipping passfail badge.")
             return
-        
-        import pybadges
 
         badge_data = self.get_passfail_badge_data(name, passing)
-        data = pybadges.badge(
-            left_text=badge_data[0], right_text=badge_data[1], right_color=badge_data[2]
-        )
+        data = _render_badge(*badge_data)
         badgefile = self.get_badgefile(name)
         self._absbadge.replace_badge(badgefile, *badge_data)
         self._write(badgefile, data)
@@ -1355,7 +2091,7 @@ class CalVersion:
 
         if (
             not isinstance(oldver, list)
-            or not all([e.isdigit() for e in oldver])
+            or not all(e.isdigit() for e in oldver)
             or len(oldver) > self.VER_PATCH + 1
             or int(oldver[self.VER_MONTH]) > 12
             or int(oldver[self.VER_YEAR]) > 99
@@ -1382,8 +2118,6 @@ class CalVersion:
         This is done for cases in which there is no correct old version
         available to increment.
         """
-        from datetime import timezone
-
         date = datetime.now(timezone.utc)
         self.version = self.__versionstr(date.year, date.month, 0)
 
@@ -1398,8 +2132,6 @@ class CalVersion:
             oldversion: The old version as a list of strings. One
                 element for each part of the version.
         """
-        from datetime import timezone
-
         date = datetime.now(timezone.utc)
         oldmonth = int(oldversion[self.VER_MONTH])
         oldpatch = int(oldversion[self.VER_PATCH])
@@ -1407,7 +2139,7 @@ class CalVersion:
         patch = oldpatch + 1 if oldmonth == newmonth else 0
         self.version = self.__versionstr(date.year, date.month, patch)
 
-    def bump(self, filename: str, regex: str):
+    def bump(self, filename: str, regex: Union[str, re.Pattern]):
         """
         Replaces all regex matches with the current version.
 
@@ -1417,9 +2149,9 @@ class CalVersion:
 
         Args:
             filename: File containing a version string.
-            regex: The regular that matches the version given in the
-                file. The version must be denoted as the first group
-                in the regular expression.
+            regex: The regular expression (or precompiled pattern) that
+                matches the version given in the file. The version must
+                be denoted as the first group in the regular expression.
         """
         with open(filename, "r") as f:
             buf = str(f.read())
@@ -1472,6 +2204,13 @@ class Documentation:
         """
         Removes all documentation artifacts.
         """
+        self._remove_output()
+        remove_if_exists(self._settings.DOCUMENTATION_INSPECT_CACHE)
+
+    def _remove_output(self) -> None:
+        """
+        Removes the generated documentation, but keeps the cached inspection results.
+        """
         self.clean()
         remove_if_exists(self._settings.DOCUMENTATION_HTML_DIR)
         remove_if_empty(self._settings.REPORT_DIR)
@@ -1482,7 +2221,7 @@ class Documentation:
         """
         remove_if_exists(self._settings.DOCUMENTATION_SOURCE_DIR)
         remove_if_exists(self._settings.DOCUMENTATION_COVERAGE_FILE)
-        remove_if_empty(self._settings.TMP_DIR)
+        remove_tmp_if_empty(self._settings.TMP_DIR)
 
         for folder in self._settings.DOCUMENTATION_HTML_DIR_EXCLUDE:
             remove_if_exists(folder)
@@ -1507,9 +2246,10 @@ class Documentation:
             print(f"Skipping documentation.")
             return
         
-        self.remove()
+        self._remove_output()
 
-        # Generate new documentation
+        # Generate new documentation. Sphinx reads and writes documents with one
+        # process per CPU core (see Settings.TOOL_PARALLEL_FLAGS and docfiles/conf.py).
         step1result = not bool(
             pyexecute(
                 [
@@ -1595,7 +2335,7 @@ class StyleCheck:
         Removes intermediate artifacts.
         """
         remove_if_exists(self._settings.STYLE_REPORT_JSON)
-        remove_if_empty(self._settings.TMP_DIR)
+        remove_tmp_if_empty(self._settings.TMP_DIR)
         remove_if_empty(self._settings.REPORT_DIR)
 
     def ispassed(self) -> bool:
@@ -1659,46 +2399,50 @@ class StyleCheck:
             print(f"Skipping style check report.")
             return
         
-        if not file_has_content(self.flakefile):
+        # Open the file right away instead of checking for its content beforehand.
+        try:
+            buf = read_bytes(self.flakefile)
+        except FileNotFoundError:
+            buf = b""
+
+        if not buf:
             report.add(self._settings.REPORT_SECTION_NAME_STYLE, Report.List())
             return # Nothing to report.
 
         data = dict()
-        with open(self.flakefile, "r") as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                entries =  Report.List()
-                entries.add("Could not decode flake8 json file.", "")
-                report.add(self._settings.REPORT_SECTION_NAME_STYLE, entries)
+        try:
+            data = json_loads(buf)
+        except json.JSONDecodeError:
+            entries =  Report.List()
+            entries.add("Could not decode flake8 json file.", "")
+            report.add(self._settings.REPORT_SECTION_NAME_STYLE, entries)
 
+        cwd = os.getcwd()
         for filename, issues in data.items():
-            name = Path(filename).absolute().relative_to(Path().cwd())
-            List = Report.List(str(name))
-            for issue in issues:
+            name = relative_path(filename, cwd)
+            List = Report.List(name)
+
+            # Show all issues of a file in a single code snippet.
+            if issues:
+                lines = [issue[self.KEY_LINE] for issue in issues]
                 file = report.File(filename)
-                file.mark([issue[self.KEY_LINE]], file.COLOR_BAD)
+                file.mark(lines, file.COLOR_BAD)
                 file.set_mark_name(file.COLOR_BAD, "Finding")
                 file.range = (
-                    issue[self.KEY_LINE] - self._settings.REPORT_LINE_RANGE,
-                    issue[self.KEY_LINE] + self._settings.REPORT_LINE_RANGE,
+                    min(lines) - self._settings.REPORT_LINE_RANGE,
+                    max(lines) + self._settings.REPORT_LINE_RANGE,
                 )
                 report.add(filename, file)
+
+            for issue in issues:
                 summary = issue[self.KEY_DESCRIPTION]
+                # Adjacent f-strings are joined at compile time into one string.
                 details = (
-                    "<b>Code</b>: "
-                    + str(issue[self.KEY_CODE])
-                    + "<br />"
-                    + "<b>Line</b>: "
-                    + str(issue[self.KEY_LINE])
-                    + "<br />"
-                    + "<b>Column</b>: "
-                    + str(issue[self.KEY_COLUMN])
-                    + "<br />"
-                    + "<b>File</b>: "
-                    + f'<a href="{file.outputpath}#{issue[self.KEY_LINE]}">'
-                    + str(name)
-                    + "</a>"
+                    f"<b>Code</b>: {issue[self.KEY_CODE]}<br />"
+                    f"<b>Line</b>: {issue[self.KEY_LINE]}<br />"
+                    f"<b>Column</b>: {issue[self.KEY_COLUMN]}<br />"
+                    f'<b>File</b>: <a href="{file.outputpath}#{issue[self.KEY_LINE]}">'
+                    f"{name}</a>"
                 )
                 List.add(summary, details)
             report.add(self._settings.REPORT_SECTION_NAME_STYLE, List)
@@ -1754,7 +2498,7 @@ class TypeCheck:
         """
         remove_if_exists(self._settings.TYPE_REPORT_XML)
         remove_if_exists(self._settings.MYPY_CACHE)
-        remove_if_empty(self._settings.TMP_DIR)
+        remove_tmp_if_empty(self._settings.TMP_DIR)
         remove_if_empty(self._settings.REPORT_DIR)
 
     def ispassed(self) -> bool:
@@ -1825,17 +2569,23 @@ class TypeCheck:
         
         import defusedxml.ElementTree as et
 
-        tree = et.parse(self._settings.TYPE_REPORT_XML)
-        failurenode = tree.getroot().find(".//failure")
-        messages = str(failurenode.text) if failurenode is not None else ""
+        # Only the first failure element is needed, so stop parsing once it has been
+        # found instead of building the whole tree.
+        messages = ""
+        for _, element in et.iterparse(str(self._settings.TYPE_REPORT_XML)):
+            if element.tag == "failure":
+                messages = str(element.text)
+                break
+            element.clear()
         sections = {}
         files = {}
         lines = {}
 
         # Parse all messages
+        cwd = os.getcwd()
         for match in self.REGEX_MSG.finditer(messages):
             filename = match.group(self.GROUP_FILENAME).strip()
-            filename = str(Path(filename).absolute().relative_to(Path().cwd()))
+            filename = relative_path(filename, cwd)
             line = int(match.group(self.GROUP_LINE).strip())
             msgtype = match.group(self.GROUP_TYPE).strip().capitalize()
             msg = match.group(self.GROUP_MSG).strip()
@@ -1854,9 +2604,9 @@ class TypeCheck:
             summary = f"<b>{code}</b>: {msg}"
             details = (
                 f"<b>Line</b>: {line}<br />"
-                + f"<b>Type</b>: {msgtype} <br />"
-                + f"<b>Code</b>: {code} <br />"
-                + f'<b>File</b>: <a href="{files[filename].outputpath}#{line}">{filename}</a>'
+                f"<b>Type</b>: {msgtype} <br />"
+                f"<b>Code</b>: {code} <br />"
+                f'<b>File</b>: <a href="{files[filename].outputpath}#{line}">{filename}</a>'
             )
             sections[filename].add(summary, details)
 
@@ -1889,6 +2639,20 @@ class SecurityCheck:
     KEY_BANDIT_INFO = "more_info"
     KEY_BANDIT_LINES = "line_range"
 
+    CACHE_FINGERPRINT = "fingerprint"
+    CACHE_PASSED = "passed"
+    CACHE_REPORT = "report"
+
+    SUMMARY_TEMPLATE = "<b>{name}</b>: {description}"
+    DETAIL_TEMPLATE = (
+        "<b>Test ID</b>: {testid}<br />"
+        "<b>Severity</b>: {severity}<br />"
+        "<b>Confidence</b>: {confidence}<br />"
+        '<b>File</b>: <a href="{link}">{file}</a><br />'
+        "<b>Line(s)</b>: {lines}<br />"
+        '<b>More Information</b>: <a href="{info}">{info}</a>'
+    )
+
     @classmethod
     def get_requirements(cls, settings: Settings):
         if "CHECK_SECURITY" in settings.FEATURES:
@@ -1906,6 +2670,7 @@ class SecurityCheck:
         """
         self._settings = settings
         self.banditfilename = ""
+        self.banditdata = None
         self._passed = False
         self.active = "CHECK_SECURITY" in settings.FEATURES
 
@@ -1916,6 +2681,7 @@ class SecurityCheck:
         self.clean()
 
         remove_if_exists(self._settings.REPORT_HTML)
+        remove_if_exists(self._settings.SECURITY_BANDIT_CACHE)
 
     def clean(self) -> None:
         """
@@ -1923,7 +2689,7 @@ class SecurityCheck:
         """
 
         remove_if_exists(self.banditfilename)
-        remove_if_empty(self._settings.TMP_DIR)
+        remove_tmp_if_empty(self._settings.TMP_DIR)
 
     def ispassed(self) -> bool:
         """
@@ -1951,21 +2717,91 @@ class SecurityCheck:
 
         # Create json for parsing by package.py.
         self.banditfilename = str(self._settings.SECURITY_BANDIT_JSON)
+        cmd = [
+            "bandit",
+            "--quiet",
+            "-r",
+            str(self._settings.SRC_DIR),
+            "-f",
+            "json",
+            "-o",
+            self.banditfilename,
+        ]
 
-        return not bool(
-            pyexecute(
-                [
-                    "bandit",
-                    "--quiet",
-                    "-r",
-                    str(self._settings.SRC_DIR),
-                    "-f",
-                    "json",
-                    "-o",
-                    self.banditfilename,
-                ]
-            )
-        )
+        # Reuse the results of the last run, if neither the source code nor bandit
+        # changed since then.
+        fingerprint = self._fingerprint(cmd)
+        cachefile = self._settings.SECURITY_BANDIT_CACHE
+        try:
+            cache = json_loads(read_bytes(cachefile))
+            if cache[self.CACHE_FINGERPRINT] == fingerprint:
+                report = cache[self.CACHE_REPORT]
+                write_if_changed(self.banditfilename, report.encode("utf-8"))
+                self._keep(report)
+                return bool(cache[self.CACHE_PASSED])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass  # No usable cache. Run bandit instead.
+
+        passed = not bool(pyexecute(cmd))
+
+        try:
+            report = read_bytes(self.banditfilename).decode("utf-8")
+        except OSError:
+            return passed  # Nothing to cache, e.g. because bandit crashed.
+        self._keep(report)
+
+        cache = {
+            self.CACHE_FINGERPRINT: fingerprint,
+            self.CACHE_PASSED: passed,
+            self.CACHE_REPORT: report,
+        }
+        write_if_changed(cachefile, json_dumps(cache))
+        return passed
+
+    def _keep(self, report: str) -> None:
+        """
+        Keeps the parsed bandit results, so that report() does not need to read them
+        from disk again.
+
+        Args:
+            report: The content of the bandit json file.
+        """
+        try:
+            self.banditdata = json_loads(report)
+        except ValueError:
+            self.banditdata = None  # Let report() handle the broken file.
+
+    def _fingerprint(self, cmd: list) -> str:
+        """
+        Returns a fingerprint of everything the result of a bandit run depends on.
+
+        This includes the version of bandit, its arguments as well as path,
+        modification time and size of each file in the source directory.
+
+        Args:
+            cmd: The command used to run bandit.
+
+        Returns:
+            The fingerprint as hex string.
+        """
+        from importlib.metadata import PackageNotFoundError, version
+
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            digest.update(version("bandit").encode("utf-8"))
+        except PackageNotFoundError:
+            pass  # Will be reported when running bandit.
+        digest.update("\0".join(cmd).encode("utf-8"))
+
+        for root, dirs, files in os.walk(self._settings.SRC_DIR):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                st = os.stat(path)
+                entry = f"\n{path}\0{st.st_mtime_ns}\0{st.st_size}"
+                digest.update(entry.encode("utf-8"))
+
+        return digest.hexdigest()
 
     def run(self) -> bool:
         """
@@ -1981,6 +2817,7 @@ class SecurityCheck:
         
         self.clean()
         self.banditfilename = ""
+        self.banditdata = None
 
         return self._bandit()
 
@@ -1996,7 +2833,8 @@ class SecurityCheck:
             return
 
         # Check whether report fole exists.
-        if not os.path.isfile(str(self.banditfilename)):
+        data = self.banditdata
+        if data is None and not os.path.isfile(str(self.banditfilename)):
             List = Report.List()
             List.add("Analysis failed.", "")
             report.add(self._settings.REPORT_SECTION_NAME_SECURITY, List)
@@ -2004,62 +2842,47 @@ class SecurityCheck:
 
         # Generate security report.
         print("Generating security report")
-        with open(self.banditfilename, "r") as f:
-            data = json.load(f)
-            security = Report.List()
-
-            if self.KEY_BANDIT_RESULTS not in data:
-                data[self.KEY_BANDIT_RESULTS] = list()
-
-            for entry in data[self.KEY_BANDIT_RESULTS]:
-                filename = str(entry[self.KEY_BANDIT_FILENAME])
-                relfilename = str(Path(filename).absolute().relative_to(Path().cwd()))
-                file = report.File(relfilename)
-                minline = min(entry[self.KEY_BANDIT_LINES])
-                maxline = max(entry[self.KEY_BANDIT_LINES])
-                file.mark(entry[self.KEY_BANDIT_LINES], file.COLOR_BAD)
-                file.set_mark_name(file.COLOR_BAD, "Finding")
-                file.range = (
-                    minline - self._settings.REPORT_LINE_RANGE,
-                    maxline + self._settings.REPORT_LINE_RANGE,
-                )
-                report.add(filename, file)
-                print("result entry: ", entry)
+        if data is None:
+            data = json_loads(read_bytes(self.banditfilename))
+        security = Report.List()
+
+        if self.KEY_BANDIT_RESULTS not in data:
+            data[self.KEY_BANDIT_RESULTS] = list()
+
+        cwd = os.getcwd()
+        add_finding = security.add
+        for entry in data[self.KEY_BANDIT_RESULTS]:
+            filename = str(entry[self.KEY_BANDIT_FILENAME])
+            relfilename = relative_path(filename, cwd)
+            file = report.File(relfilename)
+            lines = entry[self.KEY_BANDIT_LINES]
+            minline = min(lines)
+            maxline = max(lines)
+            file.mark(lines, file.COLOR_BAD)
+            file.set_mark_name(file.COLOR_BAD, "Finding")
+            file.range = (
+                minline - self._settings.REPORT_LINE_RANGE,
+                maxline + self._settings.REPORT_LINE_RANGE,
+            )
+            report.add(filename, file)
 
-                summary = (
-                    "<b>"
-                    + entry[self.KEY_BANDIT_TESTNAME]
-                    + "</b>: "
-                    + entry[self.KEY_BANDIT_DESCRIPTION]
-                )
-                detail = (
-                    "<b>Test ID</b>: "
-                    + str(entry[self.KEY_BANDIT_TESTID])
-                    + "<br />"
-                    + "<b>Severity</b>: "
-                    + str(entry[self.KEY_BANDIT_SEVERITY])
-                    + "<br />"
-                    + "<b>Confidence</b>: "
-                    + str(entry[self.KEY_BANDIT_CONFIDENCE])
-                    + "<br />"
-                    + "<b>File</b>: "
-                    + f'<a href="{file.outputpath}#{minline}">'
-                    + relfilename
-                    + "</a>"
-                    + "<br />"
-                    + "<b>Line(s)</b>: "
-                    + ", ".join([str(e) for e in entry[self.KEY_BANDIT_LINES]])
-                    + "<br />"
-                    + '<b>More Information</b>: <a href="'
-                    + str(entry[self.KEY_BANDIT_INFO])
-                    + '">'
-                    + str(entry[self.KEY_BANDIT_INFO])
-                    + "</a>"
-                )
+            summary = self.SUMMARY_TEMPLATE.format(
+                name=entry[self.KEY_BANDIT_TESTNAME],
+                description=entry[self.KEY_BANDIT_DESCRIPTION],
+            )
+            detail = self.DETAIL_TEMPLATE.format(
+                testid=entry[self.KEY_BANDIT_TESTID],
+                severity=entry[self.KEY_BANDIT_SEVERITY],
+                confidence=entry[self.KEY_BANDIT_CONFIDENCE],
+                link=f"{file.outputpath}#{minline}",
+                file=relfilename,
+                lines=", ".join(map(str, lines)),
+                info=entry[self.KEY_BANDIT_INFO],
+            )
 
-                security.add(summary, detail)
+            add_finding(summary, detail)
 
-            report.add(self._settings.REPORT_SECTION_NAME_SECURITY, security)
+        report.add(self._settings.REPORT_SECTION_NAME_SECURITY, security)
 
 
 class Test:
@@ -2175,42 +2998,38 @@ class Test:
             report.add(self._settings.REPORT_SECTION_NAME_TEST, List)
             return
 
-        with open(self.coveragefile, "r") as f:
-            data = json.load(f)
-            filelist = data[self.KEY_FILES]
-            table = Report.Table(
-                "", ["Module", "Statements", "Missing", "Excluded", "Coverage"]
+        data = json_loads(read_bytes(self.coveragefile))
+        filelist = data[self.KEY_FILES]
+        table = Report.Table(
+            "", ["Module", "Statements", "Missing", "Excluded", "Coverage"]
+        )
+        add_row = table.add
+        for filename, content in filelist.items():
+            file = report.File(filename)
+            file.mark(content[self.KEY_EXECUTED], file.COLOR_GOOD)
+            file.mark(content[self.KEY_MISSING], file.COLOR_BAD)
+            file.mark(content[self.KEY_EXCLUDED], file.COLOR_NEUTRAL)
+            file.set_mark_name(file.COLOR_GOOD, "Run")
+            file.set_mark_name(file.COLOR_BAD, "Missing")
+            file.set_mark_name(file.COLOR_NEUTRAL, "Excluded")
+            report.add(filename, file)
+
+            summary = content[self.KEY_SUMMARY]
+            add_row(
+                f'<a href="{file.outputpath}">{filename}</a>',
+                summary[self.KEY_NUM_STATEMENTS],
+                summary[self.KEY_NUM_MISSING],
+                summary[self.KEY_NUM_EXCLUDED],
+                f"{round(summary[self.KEY_COVERAGE], 2)}\u202F%",
             )
-            for filename, content in filelist.items():
-                file = report.File(filename)
-                file.mark(content[self.KEY_EXECUTED], file.COLOR_GOOD)
-                file.mark(content[self.KEY_MISSING], file.COLOR_BAD)
-                file.mark(content[self.KEY_EXCLUDED], file.COLOR_NEUTRAL)
-                file.set_mark_name(file.COLOR_GOOD, "Run")
-                file.set_mark_name(file.COLOR_BAD, "Missing")
-                file.set_mark_name(file.COLOR_NEUTRAL, "Excluded")
-                report.add(filename, file)
 
-                nstatements = content[self.KEY_SUMMARY][self.KEY_NUM_STATEMENTS]
-                nmissing = content[self.KEY_SUMMARY][self.KEY_NUM_MISSING]
-                nexcluded = content[self.KEY_SUMMARY][self.KEY_NUM_EXCLUDED]
-                coverage = (
-                    str(round(content[self.KEY_SUMMARY][self.KEY_COVERAGE], 2))
-                    + "\u202F%"
-                )
-                table.add(
-                    f'<a href="{file.outputpath}">{filename}</a>',
-                    nstatements,
-                    nmissing,
-                    nexcluded,
-                    coverage,
-                )
-                table.summary = (
-                    "Coverage",
-                    math.floor(data[self.KEY_TOTALS][self.KEY_COVERAGE]),
-                    "%",
-                )
-            report.add(self._settings.REPORT_SECTION_NAME_TEST, table)
+        if filelist:
+            table.summary = (
+                "Coverage",
+                math.floor(data[self.KEY_TOTALS][self.KEY_COVERAGE]),
+                "%",
+            )
+        report.add(self._settings.REPORT_SECTION_NAME_TEST, table)
 
 
 class Build:
@@ -2243,14 +3062,7 @@ class Build:
         self._passed = False
         self.active = "BUILD_WHEELS" in settings.FEATURES
 
-        with open(self._settings.CONFIGFILE, "r") as f:
-            buf = str(f.read())
-            match = re.search(r"name[ ]*=[ ]*\"([^\n\" ]+)", buf)
-
-            if match is None:
-                raise LookupError("Could not determine package name.")
-
-            self.packagename = match.group(1).strip()
+        self.packagename = str(Meta(settings.CONFIGFILE).get("name")).strip()
 
     def remove(self) -> None:
         """
@@ -2262,11 +3074,7 @@ class Build:
 
         print("Removing contents of ", str(distdir / distfiles))
 
-        for f in glob.glob(str(distdir / distfiles) + "*.*"):
-            print("removing ", f)
-            remove_if_exists(f)
-
-        for f in glob.glob(str(distdir / self.packagename) + "*.*"):
+        for f in list_matching(distdir, distfiles + "*.*", self.packagename + "*.*"):
             print("removing ", f)
             remove_if_exists(f)
 
@@ -2276,7 +3084,7 @@ class Build:
         """
         Remove intermediate artifacts and folders.
         """
-        for f in glob.glob(str(self._settings.SRC_DIR / "*.egg-info")):
+        for f in list_matching(self._settings.SRC_DIR, "*.egg-info"):
             remove_if_exists(f)
 
         remove_if_exists(self._settings.BUILD_DIR)
@@ -2321,10 +3129,13 @@ class DocInspector:
     documentation missing.
     """
 
-    REGEX_PARAMETERS = re.compile(r":param[ ]*([^:]+):")
+    REGEX_PARAMETERS = re.compile(r":param[ ]*([^:\n]+):")
     REGEX_FIELD = re.compile(r":[^:]+:")
+    # Only triple-quoted strings may span several lines. Bounding the other literals
+    # to a single line keeps a stray quote from scanning the rest of the source.
     REGEX_DOC = re.compile(
-        r"(\"\"\".*?\"\"\"|#[^\n]*|\".*?\"|\'.*?\')", re.MULTILINE | re.DOTALL
+        r"(\"\"\".*?\"\"\"|\'\'\'.*?\'\'\'|#[^\n]*|\"[^\"\n]*\"|\'[^\'\n]*\')",
+        re.DOTALL,
     )
     REGEX_RETURN_NONE = re.compile(r"return([ ]*None|[ ]*[$\n])")
     REGEX_RETURN = re.compile(r"return[ ]+(\w|\d|[\[{\(])")
@@ -2333,6 +3144,17 @@ class DocInspector:
         r"([ \t]+)(def|class)[ ]+[^:]+:\n(\1[ \t]+[^ ][^\n]+\n|[ ]*\n|\1[ \t]+[^ ])+"
     )
 
+    SUMMARY_TEMPLATE = "<b>{issue}</b>: {name}"
+    DETAIL_TEMPLATE = (
+        "<b>Object</b>: {name}<br />"
+        '<b>File</b>: <a href="{link}">{file}</a><br />'
+        "<b>Line</b>: {line}<br />"
+        "{text}"
+    )
+
+    # Return statements within these nodes do not belong to the inspected function.
+    NESTED_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+
     UNUSED = "Unused"
     DOCUMENTED = "Documented"
     UNDOCUMENTED = "Undocumented"
@@ -2355,6 +3177,21 @@ class DocInspector:
 
     JSON_INDENT = 4
 
+    RECORD_ISSUE = "issue"
+    RECORD_DOCUMENTED = "documented"
+
+    # Attribute of the sphinx environment in which results are handed over from
+    # parallel worker processes to the main process.
+    ENV_RECORDS = "docinspector_records"
+
+    # Attribute of the sphinx environment in which parallel worker processes hand
+    # over the cache entries of the objects they processed.
+    ENV_CACHE = "docinspector_cache"
+
+    # Keys of the entries cached for each object.
+    CACHE_HASH = "hash"
+    CACHE_RECORDS = "records"
+
     def __init__(self, settings: Settings) -> None:
         """
         Initializes the class with settings.
@@ -2368,6 +3205,10 @@ class DocInspector:
         self.log = list()
         self.documented = {}  # Number of documented elements in each file.
         self.files = set()
+        self._records = list()  # All results in the order in which they were found.
+        self._cachefile: Optional[Path] = None
+        self._cache = {}  # Results of the previous build for each object.
+        self._current = {}  # Results of the current build for each object.
 
     def _getcleandoc(self, doc: List[str]):
         """
@@ -2395,7 +3236,10 @@ class DocInspector:
         if not callable(subject):
             raise TypeError("Given subject is not callable.")
 
-        signature = list(inspect.signature(subject).parameters.keys())
+        try:
+            signature = list(_parameter_names(subject))
+        except TypeError:  # Unhashable callable objects cannot be cached.
+            signature = list(inspect.signature(subject).parameters.keys())
 
         # Filter the "self" - parameter.
         if type == "method" and signature[0].lower() == "self":
@@ -2414,11 +3258,8 @@ class DocInspector:
             A list of strings with all parameter names that have been mentioned
             in the docstring by :param ... : .
         """
-        params = list()
-        doc = self._getcleandoc(lines)
-        for line in doc:
-            params += self.REGEX_PARAMETERS.findall(line)
-        return params
+        # Search all lines at once. The pattern does not match across line breaks.
+        return self.REGEX_PARAMETERS.findall("\n".join(self._getcleandoc(lines)))
 
     def save(self):
         """
@@ -2429,14 +3270,14 @@ class DocInspector:
         it is overwritten.
         """
 
-        mkdirs_if_not_exists(Path(self._settings.TMP_DIR))
+        mkdirs_if_not_exists(self._settings.TMP_DIR)
 
-        with open(self._settings.DOCUMENTATION_COVERAGE_FILE, "w") as f:
-            data = {
-                self.SECTION_DOCUMENTED: self.documented,
-                self.SECTION_ISSUES: self.log,
-            }
-            json.dump(data, f, indent=self.JSON_INDENT)
+        data = {
+            self.SECTION_DOCUMENTED: self.documented,
+            self.SECTION_ISSUES: self.log,
+        }
+        with open(self._settings.DOCUMENTATION_COVERAGE_FILE, "wb") as f:
+            f.write(json_dumps(data, indent=self.JSON_INDENT))
 
     def load(self):
         """
@@ -2449,10 +3290,9 @@ class DocInspector:
         if not os.path.isfile(covfile):
             raise Exception(f"Documentation coverage file {covfile} does not exist.")
 
-        with open(self._settings.DOCUMENTATION_COVERAGE_FILE, "r") as f:
-            data = json.load(f)
-            self.documented = data[self.SECTION_DOCUMENTED]
-            self.log = data[self.SECTION_ISSUES]
+        data = json_loads(read_bytes(self._settings.DOCUMENTATION_COVERAGE_FILE))
+        self.documented = data[self.SECTION_DOCUMENTED]
+        self.log = data[self.SECTION_ISSUES]
 
     def _getParameter(
         self, subject: object, lines: list, type: str, check: str
@@ -2478,21 +3318,39 @@ class DocInspector:
         Returns:
             A list of parameter names that match the given type of check.
         """
+        if check not in (self.UNDOCUMENTED, self.DOCUMENTED, self.UNUSED):
+            raise Exception("Unknown check type.")
+        return self._getParameters(subject, lines, type)[check]
+
+    def _getParameters(self, subject: object, lines: list, type: str) -> dict:
+        """
+        Returns the parameter lists of all checks supported by _getParameter().
+
+        Signature and docstring are only examined once for all checks.
+
+        Args:
+            subject: The object to get the parameter lists for.
+            lines: The docstring as given by sphinx.
+            type: The type of the subject as given by sphinx.
+
+        Returns:
+            Dictionary mapping UNDOCUMENTED, DOCUMENTED and UNUSED to the list of
+            parameter names that match the respective check.
+        """
         # These types are callable but do not have parameters.
         if type in ["exception", "class"] or not callable(subject):
-            return list()
+            return {self.UNDOCUMENTED: [], self.DOCUMENTED: [], self.UNUSED: []}
 
         signature = self._fromsignature(subject, type)
         documented = self._fromdocstring(lines)
+        documentedset = set(documented)
+        signatureset = set(signature)
 
-        if check == self.UNDOCUMENTED:
-            return [p for p in signature if p not in documented]
-        elif check == self.DOCUMENTED:
-            return [p for p in signature if p in documented]
-        elif check == self.UNUSED:
-            return [p for p in documented if p not in signature]
-        else:
-            raise Exception("Unknown check type.")
+        return {
+            self.UNDOCUMENTED: [p for p in signature if p not in documentedset],
+            self.DOCUMENTED: [p for p in signature if p in documentedset],
+            self.UNUSED: [p for p in documented if p not in signatureset],
+        }
 
     def _getDescription(self, lines: list):
         """
@@ -2530,22 +3388,110 @@ class DocInspector:
         if what not in ["method", "function"]:
             return None
 
-        source = inspect.getsource(subject).strip()  # type: ignore
+        source = "".join(_source_lines(subject)[0])
+        if "return" not in source:
+            return False
+
+        try:
+            returns = self._returnsValue(subject, source)
+        except SyntaxError:
+            # E.g. if the source cannot be dedented. Fall back to searching the text.
+            returns = self._returnsValueText(source.strip())
+        if not returns:
+            return False
+
+        # Detect, whether return values are part of the docstring.
+        return self.REGEX_DOCRETURN.search("\n".join(lines)) is None
+
+    def _returnsValue(self, subject: object, source: str) -> bool:
+        """
+        Determines, whether the given function returns anything else than None.
+
+        Return statements of nested functions and classes are not taken into account.
+        If the source code of the function cannot be parsed on its own (e.g. because a
+        multi-line string prevents dedenting it), the function is looked up in the
+        syntax tree of its file instead.
+
+        Args:
+            subject: The function to inspect.
+            source: The source code of the function.
+
+        Returns:
+            True, if there is a return statement with a value other than None.
+            False, otherwise.
+
+        Raises:
+            SyntaxError: If the source code cannot be parsed.
+        """
+        try:
+            tree = ast.parse(textwrap.dedent(source))
+            if not tree.body:
+                return False
+            function = tree.body[0]
+        except SyntaxError:
+            function = self._functionNode(subject)
+            if function is None:
+                raise
+
+        nodes = list(ast.iter_child_nodes(function))
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, ast.Return):
+                value = node.value
+                if value is not None and not (
+                    isinstance(value, ast.Constant) and value.value is None
+                ):
+                    return True
+            elif not isinstance(node, self.NESTED_NODES):
+                nodes.extend(ast.iter_child_nodes(node))
+        return False
+
+    def _functionNode(self, subject: object) -> Optional[ast.AST]:
+        """
+        Returns the syntax tree node of the given function from the tree of its file.
+
+        Args:
+            subject: The function to get the node of.
+
+        Returns:
+            The node of the function definition or None, if it cannot be found.
+        """
+        file = _source_file(subject)
+        if not file:
+            return None
+        try:
+            st = os.stat(file)
+            nodes = _function_nodes(file, st.st_mtime_ns, st.st_size)
+        except (OSError, SyntaxError, ValueError):
+            return None
+        return nodes.get(_source_lines(subject)[1])
+
+    def _returnsValueText(self, source: str) -> bool:
+        """
+        Determines, whether the given function returns anything else than None.
+
+        In contrast to _returnsValue(), this only searches the text of the source code.
+        It is used for source code that cannot be parsed.
+
+        Args:
+            source: The source code of the function.
 
+        Returns:
+            True, if there seems to be a return statement with a value other than
+            None. False, otherwise.
+        """
         # Find returns that are not None.
         # First, remove docstrings, comments and strings.
         cleaned = self.REGEX_DOC.sub("", source)
         # Second, remove "return None" or return statements without value.
         cleaned = self.REGEX_RETURN_NONE.sub("", cleaned)
+        if "return" not in cleaned:
+            return False
         # Third, remove nested functions and classes.
         cleaned = self.REGEX_NESTED.sub("", cleaned)
 
         # Find remaining return statements which mention a value or variable.
-        notNone = self.REGEX_RETURN.search(cleaned)
-        # Detect, whether return values are part of the docstring.
-        docret = self.REGEX_DOCRETURN.search("\n".join(lines))
-
-        return notNone is not None and docret is None
+        return self.REGEX_RETURN.search(cleaned) is not None
 
     def process(self, app, what, name, obj, options, lines) -> None:
         """
@@ -2567,17 +3513,32 @@ class DocInspector:
             lines: Docstring as given by sphinx.
         """
 
+        start = len(self._records)
+
         try:
-            file = inspect.getsourcefile(obj)
+            file = _source_file(obj)
             if not file:
                 raise Exception("No source file to process.")
-            with open(file) as f:
-                content = f.read().strip()
+            # Many objects share a file, so use the cached content.
+            st = os.stat(file)
+            lines_in_file = _read_lines(file, st.st_mtime_ns, st.st_size)
+            content = any(line.strip() for line in lines_in_file)
         except Exception:
             # Only evaluate objects for which a file can be determined.
             # For example, properties are not supported in Python 3.9.1.
             return
 
+        # Reuse the results of the previous build, if neither docstring nor source
+        # code of the object have changed since then.
+        key = f"{what} {name}"
+        fingerprint = self._fingerprint(obj, lines)
+        cached = self._cache.get(key)
+        if cached is not None and cached[self.CACHE_HASH] == fingerprint:
+            for record in cached[self.CACHE_RECORDS]:
+                self._apply(tuple(record))
+            self._remember(app, key, fingerprint, start)
+            return
+
         # Check presence of description. If the file is empty, no issue is created,
         # because one does not need to document nothingness.
         if content and self._getDescription(lines) is None:
@@ -2599,13 +3560,14 @@ class DocInspector:
                 name,
                 self.ISSUE_UNDOC_RETURN,
                 f"The return value of {what} {name} is not documented. Note that "
-                + "this message may also have been caused by incorrect indentation.",
+                "this message may also have been caused by incorrect indentation.",
             )
         else:
             self.add_documented(file)
 
         # Check presence of parameters.
-        undocParameters = self._getParameter(obj, lines, what, self.UNDOCUMENTED)
+        parameters = self._getParameters(obj, lines, what)
+        undocParameters = parameters[self.UNDOCUMENTED]
         for param in undocParameters:
             self.add_issue(
                 obj,
@@ -2616,7 +3578,7 @@ class DocInspector:
             )
 
         # Check for superfluous parameters.
-        unusedParameters = self._getParameter(obj, lines, what, self.UNUSED)
+        unusedParameters = parameters[self.UNUSED]
         for param in unusedParameters:
             self.add_issue(
                 obj,
@@ -2624,16 +3586,142 @@ class DocInspector:
                 param,
                 self.ISSUE_UNUSED_PARAM,
                 f"Parameter {param} of {what} {name} has been documented although it "
-                + f"is not part of the {what}'s signature. Note that this may also be "
-                + "a false positive caused by incorrect indentation. This means "
-                + "parameter documentation exceeding a single line needs to be "
-                + "indented by a single tab.",
+                f"is not part of the {what}'s signature. Note that this may also be "
+                "a false positive caused by incorrect indentation. This means "
+                "parameter documentation exceeding a single line needs to be "
+                "indented by a single tab.",
             )
 
         # Add documented parameters to the number of documented elements.
-        docParameters = self._getParameter(obj, lines, what, self.DOCUMENTED)
+        docParameters = parameters[self.DOCUMENTED]
         self.add_documented(file, len(docParameters))
 
+        self._remember(app, key, fingerprint, start)
+
+    def _fingerprint(self, obj, lines: list) -> str:
+        """
+        Returns a hash over everything the results of process() depend on.
+
+        Args:
+            obj: The object as given by sphinx.
+            lines: Docstring as given by sphinx.
+
+        Returns:
+            Hexadecimal hash of the object's file, source code and docstring.
+        """
+        try:
+            file = _source_file(obj)
+            source, lineno = _source_lines(obj)
+        except Exception:
+            file, source, lineno = None, [], 0
+
+        fingerprint = hashlib.blake2b(digest_size=16)
+        fingerprint.update(f"{file}:{lineno}\n".encode("utf-8"))
+        fingerprint.update("".join(source).encode("utf-8"))
+        fingerprint.update("\n".join(lines).encode("utf-8"))
+        return fingerprint.hexdigest()
+
+    def _remember(self, app, key: str, fingerprint: str, start: int) -> None:
+        """
+        Stores the results found since the given record index for the given object.
+
+        Args:
+            app: The Sphinx application object.
+            key: The key identifying the object.
+            fingerprint: The hash as returned by _fingerprint().
+            start: Index of the first record that belongs to the object.
+        """
+        entry = {
+            self.CACHE_HASH: fingerprint,
+            self.CACHE_RECORDS: self._records[start:],
+        }
+        self._current[key] = entry
+
+        if app is not None and app.env is not None:
+            cache = getattr(app.env, self.ENV_CACHE, None)
+            if cache is None:
+                cache = dict()
+                setattr(app.env, self.ENV_CACHE, cache)
+            cache[key] = entry
+
+        self._share(app, start)
+
+    def _share(self, app, start: int) -> None:
+        """
+        Stores the results found since the given record index in the sphinx environment.
+
+        In parallel builds, sphinx reads documents in worker processes and only hands
+        the environment over to the main process. Storing the results there allows
+        the main process to merge them (see merge method).
+
+        Args:
+            app: The Sphinx application object.
+            start: Index of the first record to store.
+        """
+        if app is None or app.env is None:
+            return
+
+        records = getattr(app.env, self.ENV_RECORDS, None)
+        if records is None:
+            records = list()
+            setattr(app.env, self.ENV_RECORDS, records)
+        records.extend(self._records[start:])
+
+    def _apply(self, record: Tuple[str, object]) -> None:
+        """
+        Adds a result to the internal log or the counter of documented elements.
+
+        Args:
+            record: Tuple consisting of the record type (RECORD_ISSUE or
+                RECORD_DOCUMENTED) and the record data.
+        """
+        recordtype, data = record
+        if recordtype == self.RECORD_ISSUE:
+            self.log.append(data)
+        else:
+            file, count = data  # type: ignore
+            self.documented[file] = self.documented.get(file, 0) + count
+        self._records.append(record)
+
+    def reset(self, app) -> None:
+        """
+        Method for handling the "builder-inited" sphinx event.
+
+        Discards results that a previous build may have stored in the sphinx
+        environment and loads the results cached by the previous build.
+
+        Args:
+            app: The Sphinx application object.
+        """
+        setattr(app.env, self.ENV_RECORDS, list())
+        setattr(app.env, self.ENV_CACHE, dict())
+
+        self._cachefile = self._settings.DOCUMENTATION_INSPECT_CACHE
+        self._cache = {}
+        try:
+            self._cache = json_loads(read_bytes(self._cachefile))
+        except (OSError, json.JSONDecodeError):
+            pass  # No cache available. All objects are processed.
+
+    def merge(self, app, env, docnames, other) -> None:
+        """
+        Method for handling the "env-merge-info" sphinx event.
+
+        Adds the results found by a parallel worker process to this instance. Since
+        workers start with a copy of the main process' environment, only records
+        beyond that copy are new.
+
+        Args:
+            app: The Sphinx application object.
+            env: The environment of the main process.
+            docnames: The documents read by the worker process.
+            other: The environment of the worker process.
+        """
+        known = len(getattr(env, self.ENV_RECORDS, None) or [])
+        for record in (getattr(other, self.ENV_RECORDS, None) or [])[known:]:
+            self._apply(tuple(record))
+        self._current.update(getattr(other, self.ENV_CACHE, None) or {})
+
     def add_issue(self, obj, what, name, issuetype, text):
         """
         Adds an issue to the internal log.
@@ -2647,20 +3735,19 @@ class DocInspector:
         """
         start = end = 1
         if what != "module":
-            lines = inspect.getsourcelines(obj)
+            lines = _source_lines(obj)
             start = 1 if lines[1] == 0 else lines[1]
             end = lines[1] + len(lines[0])
 
-        self.log += [
-            {
-                self.KEY_ISSUE: issuetype,
-                self.KEY_WHAT: what,
-                self.KEY_OBJNAME: name,
-                self.KEY_FILE: inspect.getsourcefile(obj),
-                self.KEY_LINES: (start, end),
-                self.KEY_TEXT: text,
-            }
-        ]
+        entry = {
+            self.KEY_ISSUE: issuetype,
+            self.KEY_WHAT: what,
+            self.KEY_OBJNAME: name,
+            self.KEY_FILE: _source_file(obj),
+            self.KEY_LINES: (start, end),
+            self.KEY_TEXT: text,
+        }
+        self._apply((self.RECORD_ISSUE, entry))
 
     def add_documented(self, file, count=1):
         """
@@ -2670,9 +3757,7 @@ class DocInspector:
             file: The file to increment the counter for.
             count: The number of elements to add to the current count.
         """
-        self.documented[file] = (
-            self.documented[file] + count if file in self.documented else count
-        )
+        self._apply((self.RECORD_DOCUMENTED, (file, count)))
 
     def finish(self, *args) -> None:
         """
@@ -2683,6 +3768,9 @@ class DocInspector:
         """
         self.save()
 
+        if self._cachefile is not None:
+            write_if_changed(self._cachefile, json_dumps(self._current))
+
     def get_coverage(self, file: Optional[str] = None) -> float:
         """
         Returns the documentation coverage in percent.
@@ -2705,11 +3793,11 @@ class DocInspector:
         numdoc = 0
         numundoc = 0
         if file is None:
-            numdoc = sum([v for v in self.documented.values()])
+            numdoc = sum(self.documented.values())
             numundoc = len(self.log)
         else:
             numdoc = self.documented[file]
-            numundoc = len([e for e in self.log if e[self.KEY_FILE] == file])
+            numundoc = sum(1 for e in self.log if e[self.KEY_FILE] == file)
 
         if numdoc + numundoc == 0:
             return 0 # Avoid division by zero.
@@ -2725,41 +3813,42 @@ class DocInspector:
         """
         issues = report.List()
 
+        # Show all issues of a file in a single code snippet.
+        ranges = {}
         for entry in self.log:
-            filename = entry[self.KEY_FILE]
-            relfilename = Path(filename).absolute().relative_to(Path().cwd())
-            minline = min(entry[self.KEY_LINES])
-            maxline = max(entry[self.KEY_LINES])
+            ranges.setdefault(entry[self.KEY_FILE], []).append(entry[self.KEY_LINES])
+
+        cwd = os.getcwd()
+        files = {}
+        for filename, lineranges in ranges.items():
+            relfilename = relative_path(filename, cwd)
             file = report.File(filename)
-            file.mark(min(entry[self.KEY_LINES]), file.COLOR_BAD)
+            file.mark([min(lines) for lines in lineranges], file.COLOR_BAD)
             file.set_mark_name(file.COLOR_BAD, "Finding")
             file.range = (
-                minline - self._settings.REPORT_LINE_RANGE,
-                maxline + self._settings.REPORT_LINE_RANGE,
+                min(map(min, lineranges)) - self._settings.REPORT_LINE_RANGE,
+                max(map(max, lineranges)) + self._settings.REPORT_LINE_RANGE,
             )
-            report.add(str(relfilename), file)
+            report.add(relfilename, file)
+            files[filename] = (relfilename, file)
+
+        add_issue = issues.add
+        for entry in self.log:
+            relfilename, file = files[entry[self.KEY_FILE]]
+            minline = min(entry[self.KEY_LINES])
 
-            summary = (
-                "<b>"
-                + entry[self.KEY_ISSUE].capitalize()
-                + "</b>: "
-                + entry[self.KEY_OBJNAME]
+            summary = self.SUMMARY_TEMPLATE.format(
+                issue=entry[self.KEY_ISSUE].capitalize(),
+                name=entry[self.KEY_OBJNAME],
             )
-            detail = (
-                "<b>Object</b>: "
-                + entry[self.KEY_OBJNAME]
-                + "<br />"
-                + "<b>File</b>: "
-                + f'<a href="{file.outputpath}#{minline}">'
-                + str(relfilename)
-                + "</a>"
-                + "<br />"
-                + "<b>Line</b>: "
-                + str(min(entry[self.KEY_LINES]))
-                + "<br />"
-                + entry[self.KEY_TEXT]
+            detail = self.DETAIL_TEMPLATE.format(
+                name=entry[self.KEY_OBJNAME],
+                link=f"{file.outputpath}#{minline}",
+                file=relfilename,
+                line=minline,
+                text=entry[self.KEY_TEXT],
             )
-            issues.add(summary, detail)
+            add_issue(summary, detail)
         issues.summary = ("Coverage", math.floor(self.get_coverage()), "%")
         report.add(self._settings.REPORT_SECTION_NAME_DOCUMENTATION, issues)
 
@@ -2775,6 +3864,8 @@ class Manager:
 
     CMD_CHOICES = ["build", "report", "doc", "remove"]
 
+    REGEX_CONFIG_VERSION = re.compile(r"(version[ ]*=)[ ]*\"[^\n]*\"")
+
     def __init__(self, settings: Settings) -> None:
         """
         Initializes the instance with settings.
@@ -2872,6 +3963,11 @@ class Manager:
             Badge.get_requirements(self._settings) + 
             [("setuptools", None, None)]
         )
+        # Several tools may need the same module. Only check it once.
+        unique = {}
+        for requirement in requirements:
+            unique.setdefault(requirement[0], requirement)
+        requirements = list(unique.values())
 
         notinstalled = require(requirements, False) # type: ignore
 
@@ -2940,21 +4036,23 @@ class Manager:
             False, otherwise.
         """
 
-        if not quiet:
-            print("Checking dependencies...")
-        secresult = self._security.run()
         if not quiet:
             print("Styling code...")
         styleresult = self._style.run()
         if not quiet:
-            print("Checking types...")
-        typeresult = self._type.run()
-        if not quiet:
-            print("Running tests...")
-        testresult = self._test.run()
-        if not quiet:
-            print("Generating documentation...")
-        docresult = self._doc.run()
+            print(
+                "Checking security and types, running tests and generating "
+                + "documentation..."
+            )
+        # These only read the (now styled) source code, so run them in parallel.
+        results = run_checks(
+            [self._security, self._type, self._test, self._doc],
+            self._settings.TMP_DIR,
+        )
+        secresult, self._security = results[0]
+        typeresult, self._type = results[1]
+        testresult, self._test = results[2]
+        docresult, self._doc = results[3]
 
         self._render_report(keep)
 
@@ -2986,8 +4084,7 @@ class Manager:
         BUILD_PASSED = "build_passed"
 
         print(f"Setting version to {self._version}.")
-        configregex = r"(version[ ]*=)[ ]*\"[^\n]*\""
-        self._version.bump(str(self._settings.CONFIGFILE), configregex)
+        self._version.bump(str(self._settings.CONFIGFILE), self.REGEX_CONFIG_VERSION)
 
         self.remove(quiet)
         self.report(quiet, True)
@@ -3125,5 +4222,8 @@ class Manager:
 
 
 if __name__ == "__main__":
+    # Only needed when run as a script, so do not import it for sphinx's conf.py.
+    import multiprocessing
+
     multiprocessing.set_start_method("spawn")
     Manager(Settings())
@@ -0,0 +1,51 @@
+"""
+Helpers for the tests of package.py.
+
+These tests are kept apart from the package's own tests in the tests folder, because
+those are run by package.py and count towards the package's test badge. Run them
+from the repository root with:
+```
+python -m unittest discover -s package_tests
+```
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import package
+
+
+def make_settings(basedir: Path) -> package.Settings:
+    """
+    Returns settings that place all generated files in the given directory.
+
+    Args:
+        basedir: The directory to place generated files in.
+    """
+    settings = package.Settings()
+    settings.SRC_DIR = basedir / "src"
+    settings.BUILD_DIR = basedir / "build"
+    settings.TMP_DIR = basedir / "tmp"
+    settings.REPORT_DIR = basedir / "report"
+    settings.REPORT_HTML = settings.REPORT_DIR / "report.html"
+    settings.REPORT_FILES_DIR = settings.REPORT_DIR / "files"
+    settings.BADGE_FOLDER = basedir / "badges"
+    settings.DOCUMENTATION_HTML_DIR = basedir / "docs"
+    settings.DOCUMENTATION_SOURCE_DIR = basedir / "docfiles" / "source"
+    settings.DOCUMENTATION_HTML_DIR_EXCLUDE = []
+    settings.DOCUMENTATION_COVERAGE_FILE = settings.TMP_DIR / "doccoverage.json"
+    settings.DOCUMENTATION_INSPECT_CACHE = basedir / ".docinspect_cache.json"
+    settings.SECURITY_BANDIT_CACHE = basedir / ".bandit_cache.json"
+    return settings
+
+
+class TempDirTestCase(TestCase):
+    """
+    Test case that provides an empty temporary directory in self.dir.
+    """
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir, ignore_errors=True)
@@ -0,0 +1,120 @@
+from urllib.parse import quote
+
+import package
+from helpers import TempDirTestCase, make_settings
+
+
+class AbsBadgeTestCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.readme = self.dir / "README.md"
+        self.settings = make_settings(self.dir)
+        self.settings.CONFIGFILE = self.dir / "pyproject.toml"
+        self.settings.CONFIGFILE.write_text(
+            f'[project]\nreadme = "{self.readme.as_posix()}"\n', encoding="utf-8"
+        )
+
+    def _link(self, title, text, color):
+        return (
+            f"https://img.shields.io/static/v1?label={quote(title)}"
+            f"&message={quote(text)}&color={quote(color)}"
+        )
+
+    def _absbadge(self, readme):
+        self.readme.write_text(readme, encoding="utf-8")
+        return package.AbsBadge(self.settings)
+
+    def test_replaces_static_badge_files(self):
+        absbadge = self._absbadge(
+            "![Tests](data/badges/tests.svg)\n![Docs](data\\badges\\docs.svg)\n"
+        )
+        absbadge.replace_badge("data/badges/tests.svg", "tests", "passed", "green")
+        absbadge.replace_badge("data\\badges\\docs.svg", "docs", "90 %", "yellow")
+        absbadge.write_absolute_readme()
+
+        self.assertEqual(
+            self.readme.read_text(encoding="utf-8"),
+            f"![Tests]({self._link('tests', 'passed', 'green')})\n"
+            f"![Docs]({self._link('docs', '90 %', 'yellow')})\n",
+        )
+
+    def test_updates_shields_links(self):
+        old = self._link("tests", "failed", "red")
+        absbadge = self._absbadge(f"![Tests]({old}) text ![Other](other.svg)\n")
+        absbadge.replace_badge("data/badges/tests.svg", "tests", "passed", "green")
+        absbadge.write_absolute_readme()
+
+        self.assertEqual(
+            self.readme.read_text(encoding="utf-8"),
+            f"![Tests]({self._link('tests', 'passed', 'green')}) text "
+            "![Other](other.svg)\n",
+        )
+
+    def test_ignores_unknown_badges(self):
+        absbadge = self._absbadge("No badges here.\n")
+        absbadge.replace_badge("data/badges/tests.svg", "tests", "passed", "green")
+        absbadge.write_absolute_readme()
+
+        self.assertEqual(self.readme.read_text(encoding="utf-8"), "No badges here.\n")
+
+    def test_round_trip(self):
+        original = "![Tests](data/badges/tests.svg) ![Docs](data/badges/docs.svg)\n"
+        absbadge = self._absbadge(original)
+        absbadge.replace_badge("data/badges/tests.svg", "tests", "passed", "green")
+        absbadge.replace_badge("data/badges/docs.svg", "docs", "90 %", "yellow")
+        absbadge.write_absolute_readme()
+        self.assertNotEqual(self.readme.read_text(encoding="utf-8"), original)
+
+        absbadge.write_relative_readme()
+        self.assertEqual(self.readme.read_text(encoding="utf-8"), original)
+
+
+class ThresholdColorTestCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        readme = self.dir / "README.md"
+        readme.write_text("", encoding="utf-8")
+        self.settings = make_settings(self.dir)
+        self.settings.CONFIGFILE = self.dir / "pyproject.toml"
+        self.settings.CONFIGFILE.write_text(
+            f'[project]\nreadme = "{readme.as_posix()}"\n', encoding="utf-8"
+        )
+        self.badge = package.Badge(self.settings)
+
+    def test_greater_than_or_equal(self):
+        thresholds = {90: "orange", 99: "brightgreen", 94: "yellow"}
+        cases = [
+            (100, "brightgreen"),
+            (99, "brightgreen"),
+            (98.9, "yellow"),
+            (94, "yellow"),
+            (93.9, "orange"),
+            (90, "orange"),
+            (89.9, "red"),
+        ]
+        for value, color in cases:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    self.badge._getThresholdColorGTE(thresholds, value), color
+                )
+
+    def test_less_than_or_equal(self):
+        thresholds = {5: "yellow", 0: "brightgreen", 10: "orange"}
+        cases = [
+            (0, "brightgreen"),
+            (1, "yellow"),
+            (5, "yellow"),
+            (6, "orange"),
+            (10, "orange"),
+            (11, "red"),
+        ]
+        for value, color in cases:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    self.badge._getThresholdColorLTE(thresholds, value), color
+                )
+
+    def test_default_thresholds(self):
+        thresholds = self.settings.SECURITY_ISSUES_THRESHOLDS
+        self.assertEqual(self.badge._getThresholdColorLTE(thresholds, 0), "brightgreen")
+        self.assertEqual(self.badge._getThresholdColorLTE(thresholds, 1), "red")
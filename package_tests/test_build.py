@@ -0,0 +1,18 @@
+import package
+from helpers import TempDirTestCase, make_settings
+
+
+class BuildCleanTestCase(TempDirTestCase):
+    def test_clean_removes_egg_info_every_time(self):
+        settings = make_settings(self.dir)
+        build = package.Build(settings)
+        egginfo = settings.SRC_DIR / "example.egg-info"
+
+        settings.SRC_DIR.mkdir()
+        build.clean()
+        for _ in range(2):
+            egginfo.mkdir()
+            settings.BUILD_DIR.mkdir()
+            build.clean()
+            self.assertFalse(egginfo.exists())
+            self.assertFalse(settings.BUILD_DIR.exists())
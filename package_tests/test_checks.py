@@ -0,0 +1,55 @@
+import os
+from pathlib import Path
+from unittest import mock
+
+import package
+from helpers import TempDirTestCase
+
+
+class TmpDirCheck:
+    """
+    Check that uses the folder for temporary files like the real checks do.
+    """
+
+    def __init__(self, tmpdir: Path, name: str) -> None:
+        self.tmpdir = tmpdir
+        self.name = name
+        self.written = False
+
+    def run(self) -> bool:
+        package.remove_tmp_if_empty(self.tmpdir)
+        package.mkdirs_if_not_exists(self.tmpdir)
+        (self.tmpdir / self.name).write_text(self.name)
+        self.written = True
+        return True
+
+
+class RunChecksTestCase(TempDirTestCase):
+    def _run(self):
+        tmpdir = self.dir / "tmp"
+        checks = [TmpDirCheck(tmpdir, f"check{i}") for i in range(4)]
+
+        results = package.run_checks(checks, tmpdir)
+
+        self.assertEqual([r for r, _ in results], [True] * 4)
+        self.assertEqual([c.name for _, c in results], [c.name for c in checks])
+        self.assertTrue(all(c.written for _, c in results))
+        self.assertEqual(sorted(os.listdir(tmpdir)), sorted(c.name for c in checks))
+
+    def test_sequential(self):
+        with mock.patch("os.cpu_count", return_value=1):
+            self._run()
+
+    def test_parallel(self):
+        with mock.patch("os.cpu_count", return_value=4):
+            self._run()
+
+    def test_workers_keep_tmp_dir(self):
+        tmpdir = self.dir / "tmp"
+        tmpdir.mkdir()
+        with mock.patch.object(package, "_in_check_worker", True):
+            package.remove_tmp_if_empty(tmpdir)
+        self.assertTrue(tmpdir.is_dir())
+
+        package.remove_tmp_if_empty(tmpdir)
+        self.assertFalse(tmpdir.exists())
@@ -0,0 +1,48 @@
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from unittest import skipUnless
+
+import package
+from helpers import TempDirTestCase
+
+
+@skipUnless(os.environ.get("PACKAGE_SMOKE_TEST"), "set PACKAGE_SMOKE_TEST to run")
+class BuildCycleTestCase(TempDirTestCase):
+    """
+    Runs the build and remove commands on a copy of the repository.
+
+    This takes several minutes and needs all tools, so it only runs on request.
+    """
+
+    def test_build_and_remove(self):
+        base = Path(package.__file__).parent
+        for name in ["package.py", "pyproject.toml", "README.md", "LICENSE"]:
+            shutil.copy2(base / name, self.dir / name)
+        for name in ["src", "tests", "data", "docfiles"]:
+            shutil.copytree(base / name, self.dir / name)
+
+        def run(cmd):
+            subprocess.run(
+                [sys.executable, "package.py", cmd, "-q"],
+                cwd=self.dir,
+                stdin=subprocess.DEVNULL,
+                check=True,
+            )
+
+        run("build")
+        self.assertTrue(any((self.dir / "dist").iterdir()))
+        self.assertFalse((self.dir / "tmp").exists())
+        self.assertEqual(package.list_matching(self.dir / "src", "*.egg-info"), [])
+
+        run("remove")
+        for name in [
+            "dist",
+            "docs",
+            "tmp",
+            ".bandit_cache.json",
+            ".docinspect_cache.json",
+        ]:
+            self.assertFalse((self.dir / name).exists(), name)
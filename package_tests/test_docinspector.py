@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import package
+from helpers import TempDirTestCase, make_settings
+
+
+class DocInspectorCacheTestCase(TempDirTestCase):
+    def _build(self, settings, app):
+        # Runs the sphinx events of a build that documents a single object.
+        inspector = package.DocInspector(settings)
+        inspector.reset(app)
+        inspector._remember(app, "function f", "0", 0)
+        inspector.finish()
+        return inspector
+
+    def test_cache_survives_doctree_removal(self):
+        settings = make_settings(self.dir)
+        app = SimpleNamespace(env=SimpleNamespace(), doctreedir=str(self.dir / "dt"))
+        self._build(settings, app)
+        self.assertTrue(settings.DOCUMENTATION_COVERAGE_FILE.is_file())
+
+        package.Documentation(settings)._remove_output()
+
+        inspector = package.DocInspector(settings)
+        inspector.reset(app)
+        self.assertIn("function f", inspector._cache)
+
+    def test_remove_deletes_cache(self):
+        settings = make_settings(self.dir)
+        app = SimpleNamespace(env=SimpleNamespace(), doctreedir=str(self.dir / "dt"))
+        self._build(settings, app)
+
+        package.Documentation(settings).remove()
+
+        self.assertFalse(settings.DOCUMENTATION_INSPECT_CACHE.exists())
+
+
+class DocInspectorMergeTestCase(TempDirTestCase):
+    def _issue(self, name):
+        inspector = package.DocInspector
+        return (inspector.RECORD_ISSUE, {inspector.KEY_OBJNAME: name})
+
+    def test_merge_only_applies_new_records(self):
+        inspector = package.DocInspector(make_settings(self.dir))
+        documented = (inspector.RECORD_DOCUMENTED, ("a.py", 2))
+        env = SimpleNamespace(**{inspector.ENV_RECORDS: [self._issue("known")]})
+        other = SimpleNamespace(
+            **{
+                inspector.ENV_RECORDS: [
+                    self._issue("known"),
+                    self._issue("new"),
+                    documented,
+                ],
+                inspector.ENV_CACHE: {"function f": {"hash": "0"}},
+            }
+        )
+
+        inspector.merge(None, env, [], other)
+
+        self.assertEqual([e[inspector.KEY_OBJNAME] for e in inspector.log], ["new"])
+        self.assertEqual(inspector.documented, {"a.py": 2})
+        self.assertIn("function f", inspector._current)
@@ -0,0 +1,65 @@
+import os
+from unittest import TestCase
+
+import package
+from helpers import TempDirTestCase
+
+
+class ListMatchingTestCase(TempDirTestCase):
+    def test_matches_any_pattern(self):
+        for name in ["a.egg-info", "b.txt", "c.py", ".hidden.txt"]:
+            (self.dir / name).touch()
+
+        found = package.list_matching(self.dir, "*.egg-info", "*.txt")
+
+        self.assertEqual(
+            sorted(os.path.basename(f) for f in found), ["a.egg-info", "b.txt"]
+        )
+
+    def test_missing_directory(self):
+        self.assertEqual(package.list_matching(self.dir / "missing", "*"), [])
+
+    def test_reflects_changes(self):
+        self.assertEqual(package.list_matching(self.dir, "*.egg-info"), [])
+        (self.dir / "a.egg-info").mkdir()
+        self.assertEqual(len(package.list_matching(self.dir, "*.egg-info")), 1)
+
+
+class WriteIfChangedTestCase(TempDirTestCase):
+    def test_writes_new_file(self):
+        path = self.dir / "file.json"
+        self.assertTrue(package.write_if_changed(path, b"abc"))
+        self.assertEqual(path.read_bytes(), b"abc")
+
+    def test_keeps_unchanged_file(self):
+        path = self.dir / "file.json"
+        path.write_bytes(b"abc")
+        os.utime(path, ns=(0, 0))
+
+        self.assertFalse(package.write_if_changed(path, b"abc"))
+        self.assertEqual(path.stat().st_mtime_ns, 0)
+
+    def test_writes_changed_content(self):
+        path = self.dir / "file.json"
+        path.write_bytes(b"abc")
+        self.assertTrue(package.write_if_changed(path, b"abd"))
+        self.assertEqual(path.read_bytes(), b"abd")
+        self.assertTrue(package.write_if_changed(path, b"abcd"))
+        self.assertEqual(path.read_bytes(), b"abcd")
+
+
+class RelativePathTestCase(TestCase):
+    def setUp(self):
+        self.cwd = os.path.abspath(os.sep + os.path.join("repo", "pkg"))
+
+    def test_inside_of_working_directory(self):
+        expected = os.path.join("src", "a.py")
+        absolute = os.path.join(self.cwd, expected)
+        self.assertEqual(package.relative_path(absolute, self.cwd), expected)
+        self.assertEqual(package.relative_path(expected, self.cwd), expected)
+
+    def test_outside_of_working_directory(self):
+        outside = os.path.abspath(os.sep + os.path.join("repo", "other.py"))
+        self.assertEqual(
+            package.relative_path(outside, self.cwd), os.path.join("..", "other.py")
+        )
@@ -0,0 +1,57 @@
+import os
+
+import package
+from helpers import TempDirTestCase
+
+
+class MetaTestCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.configfile = self.dir / "pyproject.toml"
+        self.configfile.write_text(
+            "[project]\n"
+            'name = "example"\n'
+            'version = "1.0.0"\n'
+            'dependencies = ["requests[security] < 3", "tomli"]\n'
+            "authors = [\n"
+            '    {name = "Alice", email = "alice@example.com"},\n'
+            '    {email = "nobody@example.com"},\n'
+            '    {name = "Bob"},\n'
+            '    {name = "Alice"},\n'
+            "]\n",
+            encoding="utf-8",
+        )
+
+    def test_get(self):
+        meta = package.Meta(self.configfile)
+        self.assertEqual(meta.get("name"), "example")
+        self.assertEqual(meta.get("version"), "1.0.0")
+        with self.assertRaises(LookupError):
+            meta.get("missing")
+
+    def test_authors(self):
+        meta = package.Meta(self.configfile)
+        self.assertEqual(meta.getAuthors(), ["Alice", "Bob"])
+        self.assertTrue(meta.getCopyright().endswith(", Alice, Bob"))
+
+    def test_dependencies(self):
+        meta = package.Meta(self.configfile)
+        self.assertEqual(meta.getDependencies(), ["requests[security] < 3", "tomli"])
+
+    def test_missing_project_table(self):
+        self.configfile.write_text('[tool.other]\nname = "x"\n', encoding="utf-8")
+        meta = package.Meta(self.configfile)
+        self.assertEqual(meta.getDependencies(), [])
+        with self.assertRaises(LookupError):
+            meta.getAuthors()
+
+    def test_reparses_modified_file(self):
+        self.assertEqual(package.Meta(self.configfile).get("version"), "1.0.0")
+
+        text = self.configfile.read_text(encoding="utf-8")
+        self.configfile.write_text(text.replace("1.0.0", "1.0.10"), encoding="utf-8")
+        # Make sure the modification is noticed on file systems with coarse mtime.
+        st = os.stat(self.configfile)
+        os.utime(self.configfile, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        self.assertEqual(package.Meta(self.configfile).get("version"), "1.0.10")
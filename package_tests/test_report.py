@@ -0,0 +1,18 @@
+from unittest import skipUnless
+
+import package
+from helpers import TempDirTestCase, make_settings
+
+
+@skipUnless(package.is_installed("jinja2"), "jinja2 is not installed")
+class ReportTestCase(TempDirTestCase):
+    def test_render_after_remove(self):
+        # Mirrors the build command, which removes the report before rendering again.
+        settings = make_settings(self.dir)
+        for _ in range(2):
+            report = package.Report(settings, "example", "1.0")
+            report.remove()
+            report.render()
+            self.assertTrue(settings.REPORT_HTML.is_file())
+            report.clean()
+            self.assertFalse(settings.TMP_DIR.exists())
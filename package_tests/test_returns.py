@@ -0,0 +1,101 @@
+import textwrap
+
+import package
+from helpers import TempDirTestCase, make_settings
+
+
+def returns_value(flag):
+    if flag:
+        return 1
+    return None
+
+
+def returns_nothing():
+    def nested():
+        return 1
+
+    class Nested:
+        def method(self):
+            return 2
+
+    return
+
+
+class Methods:
+    @staticmethod
+    def documented():
+        """
+        Returns:
+            Always one.
+        """
+        return 1
+
+    def multiline(self):
+        text = """
+not indented
+"""
+        return text
+
+
+class ReturnsValueTestCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.inspector = package.DocInspector(make_settings(self.dir))
+
+    def _returns(self, source: str) -> bool:
+        return self.inspector._returnsValue(None, textwrap.dedent(source))
+
+    def test_value(self):
+        self.assertTrue(self._returns("def f():\n    return 1\n"))
+        self.assertTrue(self._returns("async def f(x):\n    return x\n"))
+        self.assertTrue(self._returns("def f(x):\n    if x:\n        return x\n"))
+
+    def test_none(self):
+        self.assertFalse(self._returns("def f():\n    return\n"))
+        self.assertFalse(self._returns("def f():\n    return None\n"))
+        self.assertFalse(self._returns("def f():\n    x = 'return 1'\n"))
+
+    def test_nested(self):
+        source = """
+        def f():
+            def g():
+                return 1
+            class C:
+                def h(self):
+                    return 2
+            return lambda: 3
+        """
+        self.assertTrue(self._returns(source))
+        self.assertFalse(self._returns(source.replace("return lambda: 3", "pass")))
+
+    def test_indented_method(self):
+        source = """
+            @staticmethod
+            def f():
+                return 1
+        """
+        self.assertTrue(self._returns(source))
+
+
+class MissingReturnTestCase(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.inspector = package.DocInspector(make_settings(self.dir))
+
+    def _missing(self, subject, what="function", lines=()):
+        return self.inspector._missingReturn(subject, list(lines), what, "name")
+
+    def test_undocumented_return(self):
+        self.assertTrue(self._missing(returns_value))
+        self.assertFalse(self._missing(returns_nothing))
+
+    def test_documented_return(self):
+        # Napoleon has already converted the docstring when sphinx passes it on.
+        lines = [":returns: Always one."]
+        self.assertFalse(self._missing(Methods.documented, "method", lines))
+
+    def test_source_that_cannot_be_dedented(self):
+        self.assertTrue(self._missing(Methods.multiline, "method"))
+
+    def test_not_a_function(self):
+        self.assertIsNone(self._missing(Methods, "class"))